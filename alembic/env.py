@@ -23,6 +23,39 @@ if config.config_file_name is not None:
 from src.db.core import Base
 target_metadata = Base.metadata
 
+
+# Columns whose narrowing migration runs on Postgres only. SQLite stores
+# VARCHAR(n) with TEXT affinity and never enforces the length, so it keeps the
+# old width there on purpose.
+_POSTGRES_ONLY_LENGTH_CHANGES = {("users", "password_hash")}
+
+
+def compare_type(context, inspected_column, metadata_column, inspected_type, metadata_type):
+    """Skip the known Postgres-only length changes when comparing SQLite.
+    Every other column uses the default comparison."""
+    if (
+        context.dialect.name == "sqlite"
+        and (metadata_column.table.name, metadata_column.name) in _POSTGRES_ONLY_LENGTH_CHANGES
+    ):
+        return False
+    return None
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Indexes flagged ``info={"postgresql_only": True}`` (e.g. the pg_trgm
+    GIN index on transactions.description) only exist on Postgres, so skip
+    them when comparing any other database instead of reporting them as
+    missing."""
+    if (
+        type_ == "index"
+        and not reflected
+        and object.info.get("postgresql_only")
+        and context.get_context().dialect.name != "postgresql"
+    ):
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -45,6 +78,8 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        compare_type=compare_type,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -68,7 +103,10 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            compare_type=compare_type,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
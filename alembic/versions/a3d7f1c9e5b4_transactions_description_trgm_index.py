@@ -0,0 +1,42 @@
+"""add a pg_trgm GIN index on transactions.description (Postgres)
+
+Revision ID: a3d7f1c9e5b4
+Revises: c5f1a8d3e7b2
+Create Date: 2026-10-16 21:00:00.000000
+
+The transaction list's description_search filters with ILIKE '%term%', which
+no B-tree can serve, so every search scanned the user's whole transaction
+history. A GIN index with gin_trgm_ops lets the planner turn the pattern into
+trigram lookups; ILIKE stays as is, and terms shorter than three characters
+still fall back to a scan. pg_trgm is Postgres-only, so the migration is
+guarded and SQLite is left untouched.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d7f1c9e5b4'
+down_revision: Union[str, Sequence[str], None] = 'c5f1a8d3e7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_transactions_description_trgm",
+        "transactions",
+        ["description"],
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("idx_transactions_description_trgm", table_name="transactions")
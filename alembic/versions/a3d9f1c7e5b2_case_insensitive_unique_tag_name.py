@@ -0,0 +1,38 @@
+"""unique index on (user_id, lower(tag_name))
+
+Revision ID: a3d9f1c7e5b2
+Revises: f7c3a9e5b1d4
+Create Date: 2026-10-16 14:00:00.000000
+
+Tag names have always been unique per user case-insensitively, but only by
+convention: create/update ran an ILIKE lookup before writing, which costs a
+round trip and still races a concurrent insert. This expression index moves
+the rule into the database so the write itself is the check. Both dialects
+support expression indexes. Existing data already satisfies the rule for
+user-created tags; a user tag differing from a system tag only by case would
+make the upgrade fail and must be renamed first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d9f1c7e5b2'
+down_revision: Union[str, Sequence[str], None] = 'f7c3a9e5b1d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "uq_user_tag_name_ci",
+        "tags",
+        ["user_id", sa.text("lower(tag_name)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_user_tag_name_ci", table_name="tags")
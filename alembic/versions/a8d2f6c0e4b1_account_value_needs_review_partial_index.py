@@ -0,0 +1,37 @@
+"""add partial index for the account_value_history review queue
+
+Revision ID: a8d2f6c0e4b1
+Revises: f5c1e7b3a9d6
+Create Date: 2026-10-16 11:00:00.000000
+
+The data-health attention list and the per-account review endpoint both filter
+account_value_history on needs_review = true, which only a small fraction of
+snapshots carry. A partial (account_id, value_date) index holds just those
+rows. Postgres and SQLite both support partial indexes; each dialect gets its
+own WHERE spelling of the boolean.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d2f6c0e4b1'
+down_revision: Union[str, Sequence[str], None] = 'f5c1e7b3a9d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_account_value_needs_review",
+        "account_value_history",
+        ["account_id", "value_date"],
+        postgresql_where=sa.text("needs_review = true"),
+        sqlite_where=sa.text("needs_review = 1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_account_value_needs_review", table_name="account_value_history")
@@ -0,0 +1,29 @@
+"""drop idx_users_email, duplicated by the uq_user_email unique constraint
+
+Revision ID: b3e9a5d1f7c2
+Revises: a8d2f6c0e4b1
+Create Date: 2026-10-16 11:15:00.000000
+
+uq_user_email is backed by its own unique B-tree on users.email, which the
+planner uses for login lookups. The explicit idx_users_email was a second,
+identical index maintained on every user insert/update. Portable index drop,
+so no dialect guard is needed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e9a5d1f7c2'
+down_revision: Union[str, Sequence[str], None] = 'a8d2f6c0e4b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_users_email", table_name="users")
+
+
+def downgrade() -> None:
+    op.create_index("idx_users_email", "users", ["email"])
@@ -0,0 +1,29 @@
+"""index transaction_tags.tag_id
+
+Revision ID: b8e2c6a4d0f9
+Revises: a3d9f1c7e5b2
+Create Date: 2026-10-16 14:30:00.000000
+
+The composite primary key (transaction_id, tag_id) serves lookups from the
+transaction side only. Listing a tag's transactions, aggregating its stats
+and deleting its links all filter on tag_id alone, which without this index
+scans every row in transaction_tags.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2c6a4d0f9'
+down_revision: Union[str, Sequence[str], None] = 'a3d9f1c7e5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_transaction_tags_tag", "transaction_tags", ["tag_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_transaction_tags_tag", table_name="transaction_tags")
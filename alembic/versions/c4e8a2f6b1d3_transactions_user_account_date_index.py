@@ -0,0 +1,40 @@
+"""replace transactions (user_id, account_id) index with (user_id, account_id, transaction_date)
+
+Revision ID: c4e8a2f6b1d3
+Revises: a1f7c3d9e2b4
+Create Date: 2026-10-16 09:00:00.000000
+
+Account-scoped transaction lists filter by user + account + date range. The
+three-column index turns that into one contiguous range read instead of an
+index intersection plus sort, and its (user_id, account_id) leading prefix
+covers everything idx_transactions_user_account served, so that index is
+dropped. Plain B-tree indexes are portable, so no dialect guard is needed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a2f6b1d3'
+down_revision: Union[str, Sequence[str], None] = 'a1f7c3d9e2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_transactions_user_account_date",
+        "transactions",
+        ["user_id", "account_id", "transaction_date"],
+    )
+    op.drop_index("idx_transactions_user_account", table_name="transactions")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_transactions_user_account",
+        "transactions",
+        ["user_id", "account_id"],
+    )
+    op.drop_index("idx_transactions_user_account_date", table_name="transactions")
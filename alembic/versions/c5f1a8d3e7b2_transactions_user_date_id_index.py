@@ -0,0 +1,40 @@
+"""replace transactions (user_id, transaction_date) index with (user_id, transaction_date, db_id)
+
+Revision ID: c5f1a8d3e7b2
+Revises: b8e2c6a4d0f9
+Create Date: 2026-10-16 20:00:00.000000
+
+The transaction list orders by (transaction_date, db_id) and pages by keyset
+on that pair. With db_id in the key, both the ordered read and the
+"rows after this cursor" range come straight off the index, scanned backwards
+for the newest-first default. Its (user_id, transaction_date) prefix covers
+everything idx_transactions_user_date served, so that index is dropped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f1a8d3e7b2'
+down_revision: Union[str, Sequence[str], None] = 'b8e2c6a4d0f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_transactions_user_date_id",
+        "transactions",
+        ["user_id", "transaction_date", "db_id"],
+    )
+    op.drop_index("idx_transactions_user_date", table_name="transactions")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_transactions_user_date",
+        "transactions",
+        ["user_id", "transaction_date"],
+    )
+    op.drop_index("idx_transactions_user_date_id", table_name="transactions")
@@ -0,0 +1,40 @@
+"""narrow users.password_hash to VARCHAR(128)
+
+Revision ID: c6f0b4e8a2d5
+Revises: b3e9a5d1f7c2
+Create Date: 2026-10-16 11:30:00.000000
+
+Passwords are hashed with bcrypt, whose encoded output is always 60 chars;
+128 leaves room for a future argon2 switch (~100 chars). Narrowing is safe on
+existing data. SQLite stores VARCHAR(n) with TEXT affinity and enforces no
+length, so the ALTER is Postgres-only.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f0b4e8a2d5'
+down_revision: Union[str, Sequence[str], None] = 'b3e9a5d1f7c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "users", "password_hash",
+        existing_type=sa.String(length=255), type_=sa.String(length=128), existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "users", "password_hash",
+        existing_type=sa.String(length=128), type_=sa.String(length=255), existing_nullable=False,
+    )
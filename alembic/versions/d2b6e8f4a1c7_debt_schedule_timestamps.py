@@ -0,0 +1,42 @@
+"""add created_at/updated_at to debt_repayment_schedules
+
+Revision ID: d2b6e8f4a1c7
+Revises: a3d7f1c9e5b4
+Create Date: 2026-10-16 22:00:00.000000
+
+Schedules used to be deleted and re-inserted on every save, so they never
+carried timestamps. They are now upserted in place, so the table gets the
+created_at/updated_at pair the other tables have and the upsert stamps
+updated_at on the months it overwrites. Existing rows are backfilled with
+the migration time; the columns stay nullable.
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b6e8f4a1c7'
+down_revision: Union[str, Sequence[str], None] = 'a3d7f1c9e5b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("debt_repayment_schedules", sa.Column("created_at", sa.DateTime(), nullable=True))
+    op.add_column("debt_repayment_schedules", sa.Column("updated_at", sa.DateTime(), nullable=True))
+    # Naive UTC, like every other timestamp the app writes.
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    schedules_tbl = sa.table(
+        "debt_repayment_schedules",
+        sa.column("created_at", sa.DateTime()),
+        sa.column("updated_at", sa.DateTime()),
+    )
+    op.get_bind().execute(schedules_tbl.update().values(created_at=now, updated_at=now))
+
+
+def downgrade() -> None:
+    op.drop_column("debt_repayment_schedules", "updated_at")
+    op.drop_column("debt_repayment_schedules", "created_at")
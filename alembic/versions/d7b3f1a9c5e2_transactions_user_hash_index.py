@@ -0,0 +1,34 @@
+"""add transactions (user_id, transaction_hash) index for dedup lookups
+
+Revision ID: d7b3f1a9c5e2
+Revises: c4e8a2f6b1d3
+Create Date: 2026-10-16 09:30:00.000000
+
+Every duplicate check (single create, bulk import, type-change rehash) filters
+on user_id + transaction_hash, and until now had no supporting index, so each
+one scanned the user's rows. The index is deliberately non-unique: imports
+with skip_duplicates=False keep a flagged duplicate under the same hash.
+Portable B-tree index, so no dialect guard is needed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b3f1a9c5e2'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a2f6b1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_transactions_user_hash",
+        "transactions",
+        ["user_id", "transaction_hash"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_transactions_user_hash", table_name="transactions")
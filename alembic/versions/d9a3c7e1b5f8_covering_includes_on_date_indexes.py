@@ -0,0 +1,59 @@
+"""add INCLUDE columns to the account/date transaction indexes (Postgres)
+
+Revision ID: d9a3c7e1b5f8
+Revises: c6f0b4e8a2d5
+Create Date: 2026-10-16 12:00:00.000000
+
+Account statement and summary reads touch only a handful of columns beyond
+the (user_id, account_id, transaction_date) / (account_id, transaction_date)
+keys. Carrying amount/type/category (and total_amount/symbol for investments)
+in the index leaf lets Postgres answer them with index-only scans instead of
+a heap visit per row. INCLUDE is Postgres-only and SQLite has no equivalent,
+so the rebuild is guarded; SQLite keeps the plain composites.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a3c7e1b5f8'
+down_revision: Union[str, Sequence[str], None] = 'c6f0b4e8a2d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("idx_transactions_user_account_date", table_name="transactions")
+    op.create_index(
+        "idx_transactions_user_account_date",
+        "transactions",
+        ["user_id", "account_id", "transaction_date"],
+        postgresql_include=["amount", "transaction_type", "category_id"],
+    )
+    op.drop_index("idx_investment_transactions_account_date", table_name="investment_transactions")
+    op.create_index(
+        "idx_investment_transactions_account_date",
+        "investment_transactions",
+        ["account_id", "transaction_date"],
+        postgresql_include=["total_amount", "symbol"],
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("idx_investment_transactions_account_date", table_name="investment_transactions")
+    op.create_index(
+        "idx_investment_transactions_account_date",
+        "investment_transactions",
+        ["account_id", "transaction_date"],
+    )
+    op.drop_index("idx_transactions_user_account_date", table_name="transactions")
+    op.create_index(
+        "idx_transactions_user_account_date",
+        "transactions",
+        ["user_id", "account_id", "transaction_date"],
+    )
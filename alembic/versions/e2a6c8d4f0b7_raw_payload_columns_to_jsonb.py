@@ -0,0 +1,57 @@
+"""store raw parsed-row payloads as JSONB on Postgres
+
+Revision ID: e2a6c8d4f0b7
+Revises: d7b3f1a9c5e2
+Create Date: 2026-10-16 10:00:00.000000
+
+parsed_imports.raw_parsed_data and skipped_transactions.parsed_data_json hold
+the full parsed CSV/PDF row. As `json` Postgres keeps them as text and
+re-parses on every read; `jsonb` stores the decoded form and allows GIN
+indexing later. The model declares JSON().with_variant(JSONB, "postgresql"),
+so on SQLite the column stays JSON (TEXT) and this migration is a no-op there.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a6c8d4f0b7'
+down_revision: Union[str, Sequence[str], None] = 'd7b3f1a9c5e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    ("parsed_imports", "raw_parsed_data", False),
+    ("skipped_transactions", "parsed_data_json", True),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column, nullable in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column, nullable in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,44 @@
+"""drop indexes subsumed by composites or too unselective to use
+
+Revision ID: e4b8d2f6a0c3
+Revises: d9a3c7e1b5f8
+Create Date: 2026-10-16 12:30:00.000000
+
+investment_transactions.transaction_type has a handful of distinct values and
+is only ever filtered alongside user_id/account_id, so its standalone B-tree
+was never chosen by the planner. On account_value_history, the unique
+constraint (account_id, value_date) already provides an index with the same
+leading columns, which makes both idx_account_value_account and the
+identical idx_account_value_account_date pure write overhead on every
+snapshot insert. Portable index drops, so no dialect guard is needed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8d2f6a0c3'
+down_revision: Union[str, Sequence[str], None] = 'd9a3c7e1b5f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_investment_transactions_type", table_name="investment_transactions")
+    op.drop_index("idx_account_value_account", table_name="account_value_history")
+    op.drop_index("idx_account_value_account_date", table_name="account_value_history")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_account_value_account_date",
+        "account_value_history",
+        ["account_id", "value_date"],
+    )
+    op.create_index("idx_account_value_account", "account_value_history", ["account_id"])
+    op.create_index(
+        "idx_investment_transactions_type",
+        "investment_transactions",
+        ["transaction_type"],
+    )
@@ -0,0 +1,41 @@
+"""add a pg_trgm GIN index on tags.tag_name (Postgres)
+
+Revision ID: e7a4c2b9d1f3
+Revises: d2b6e8f4a1c7
+Create Date: 2026-10-16 23:00:00.000000
+
+search_tags filters with ILIKE '%term%', the same substring pattern as the
+transaction description_search, so it gets the same kind of trigram index.
+pg_trgm is already installed by a3d7f1c9e5b4; the CREATE EXTENSION is kept
+so this revision stands on its own. Postgres-only, so SQLite is left
+untouched.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a4c2b9d1f3'
+down_revision: Union[str, Sequence[str], None] = 'd2b6e8f4a1c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_tags_tag_name_trgm",
+        "tags",
+        ["tag_name"],
+        postgresql_using="gin",
+        postgresql_ops={"tag_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("idx_tags_tag_name_trgm", table_name="tags")
@@ -0,0 +1,36 @@
+"""drop date-only indexes on transactions and investment_transactions
+
+Revision ID: f5c1e7b3a9d6
+Revises: e2a6c8d4f0b7
+Create Date: 2026-10-16 10:30:00.000000
+
+Every date filter in the app is scoped by owner or account, so the scans run
+on the (user_id, transaction_date) / (account_id, transaction_date)
+composites; nothing filters on transaction_date alone. The standalone date
+indexes only added write amplification to each insert on the two ingest
+tables. Portable index drops, so no dialect guard is needed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5c1e7b3a9d6'
+down_revision: Union[str, Sequence[str], None] = 'e2a6c8d4f0b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_transactions_date", table_name="transactions")
+    op.drop_index("idx_investment_transactions_date", table_name="investment_transactions")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_investment_transactions_date",
+        "investment_transactions",
+        ["transaction_date"],
+    )
+    op.create_index("idx_transactions_date", "transactions", ["transaction_date"])
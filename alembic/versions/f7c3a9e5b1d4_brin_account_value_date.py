@@ -0,0 +1,43 @@
+"""rebuild idx_account_value_date as a BRIN index (Postgres)
+
+Revision ID: f7c3a9e5b1d4
+Revises: e4b8d2f6a0c3
+Create Date: 2026-10-16 13:00:00.000000
+
+account_value_history is a daily-snapshot table whose rows land roughly in
+value_date order (the nightly job appends today's row; backfills write an
+account's history as one ascending run). A BRIN index over value_date is a
+few pages instead of a full B-tree and still prunes cross-account date-range
+scans. BRIN is Postgres-only, so the rebuild is guarded; SQLite keeps the
+plain index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c3a9e5b1d4'
+down_revision: Union[str, Sequence[str], None] = 'e4b8d2f6a0c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("idx_account_value_date", table_name="account_value_history")
+    op.create_index(
+        "idx_account_value_date",
+        "account_value_history",
+        ["value_date"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("idx_account_value_date", table_name="account_value_history")
+    op.create_index("idx_account_value_date", "account_value_history", ["value_date"])
@@ -71,21 +71,24 @@ class AuthMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         # Look up user + run revocation check. One DB roundtrip per
-        # authenticated request — fine for this app size.
+        # authenticated request — fine for this app size. Only
+        # jwt_valid_after is needed, so fetch that column rather than
+        # hydrating the full UserDB row, and release the session before the
+        # request proceeds instead of holding it for the whole handler.
         db = session_local()
         try:
-            user = db.query(UserDB).filter(UserDB.db_id == user_id).first()
-            if user is None:
-                return await call_next(request)
-            if user.jwt_valid_after is not None:
-                iat = datetime.fromtimestamp(int(iat_ts), tz=timezone.utc)
-                cutoff = user.jwt_valid_after
-                if cutoff.tzinfo is None:
-                    cutoff = cutoff.replace(tzinfo=timezone.utc)
-                if iat < cutoff:
-                    return await call_next(request)
+            row = db.query(UserDB.jwt_valid_after).filter(UserDB.db_id == user_id).first()
         finally:
             db.close()
+        if row is None:
+            return await call_next(request)
+        cutoff = row.jwt_valid_after
+        if cutoff is not None:
+            iat = datetime.fromtimestamp(int(iat_ts), tz=timezone.utc)
+            if cutoff.tzinfo is None:
+                cutoff = cutoff.replace(tzinfo=timezone.utc)
+            if iat < cutoff:
+                return await call_next(request)
 
         set_current_user_id(user_id)
         return await call_next(request)
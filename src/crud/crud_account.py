@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
 from typing import Optional, List, Dict
 from datetime import datetime
@@ -192,24 +193,18 @@ def delete_db_account(db: Session, account_id: int, user_id: int) -> bool:
         raise ValueError(f"Failed to delete account: {str(e)}")
 
 
-def update_account_balance(db: Session, account_id: int, new_balance: Decimal) -> AccountDB:
-    """Update an account's balance (used by transaction processing)"""
-    
-    db_account = db.query(AccountDB).filter(AccountDB.db_id == account_id).first()
-    if not db_account:
-        raise NotFoundError(f"Account with id {account_id} not found")
-    
-    db_account.balance = round(new_balance, 2)
-    db_account.balance_last_updated = utcnow()
-    db_account.updated_at = utcnow()
-    
-    try:
-        db.commit()
-        db.refresh(db_account)
-        return db_account
-    except Exception as e:
-        db.rollback()
-        raise ValueError(f"Failed to update account balance: {str(e)}")
+def adjust_account_balance(db: Session, account_id: int, delta: Decimal) -> None:
+    """Shift an account's balance by ``delta`` (used by transaction processing).
+
+    One ``UPDATE ... SET balance = balance + :delta``: no SELECT first, and two
+    concurrent adjustments can't overwrite each other the way a Python
+    read-modify-write can. Does not commit, so the caller commits it together
+    with the transaction change that caused it."""
+    db.execute(
+        update(AccountDB)
+        .where(AccountDB.db_id == account_id)
+        .values(balance=AccountDB.balance + round(delta, 2), balance_last_updated=utcnow())
+    )
 
 
 def get_account_stats(db: Session, user_id: int) -> AccountStats:
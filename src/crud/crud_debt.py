@@ -1,8 +1,8 @@
 from datetime import date
 from src.utils.time import utcnow
 from decimal import Decimal
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import exists, func
+from sqlalchemy.orm import Session, contains_eager, joinedload, raiseload
 from typing import Optional, List, Dict
 from uuid import UUID, uuid4
 
@@ -15,7 +15,8 @@ from src.db.core import (
     DebtRepaymentScheduleDB,
     DebtPaymentDB,
     DebtStrategy,
-    NotFoundError
+    NotFoundError,
+    bulk_upsert,
 )
 from src.logging_config import get_logger
 from src.models.debt import (
@@ -109,39 +110,58 @@ def bulk_create_or_update_schedule(db: Session, user_id: int, schedule_data: Deb
     if not account:
         raise NotFoundError("Account not found.")
 
-    # Delete existing schedule for this account to replace it
+    # Replace semantics without rewriting unchanged months: drop only the
+    # months missing from the new schedule, then upsert the rest in place on
+    # uq_user_account_month_payment (existing rows keep their uuid). A month
+    # repeated in the payload resolves to its last entry.
+    amounts_by_month = {
+        schedule.payment_month: schedule.scheduled_payment_amount
+        for schedule in schedule_data.schedules
+    }
     db.query(DebtRepaymentScheduleDB).filter(
         DebtRepaymentScheduleDB.account_id == account_id,
-        DebtRepaymentScheduleDB.user_id == user_id
-    ).delete()
-
-    new_schedules = []
-    for schedule in schedule_data.schedules:
-        new_schedules.append(
-            DebtRepaymentScheduleDB(
-                uuid=uuid4(),
-                user_id=user_id,
-                account_id=account_id,
-                payment_month=schedule.payment_month,
-                scheduled_payment_amount=schedule.scheduled_payment_amount
-            )
-        )
-    
-    db.bulk_save_objects(new_schedules)
+        DebtRepaymentScheduleDB.user_id == user_id,
+        DebtRepaymentScheduleDB.payment_month.not_in(list(amounts_by_month)),
+    ).delete(synchronize_session=False)
+
+    # ON CONFLICT DO UPDATE bypasses the ORM onupdate hook, so updated_at is
+    # stamped explicitly for the months overwritten in place.
+    now = utcnow()
+    count = bulk_upsert(
+        db,
+        DebtRepaymentScheduleDB,
+        [
+            {
+                "user_id": user_id,
+                "account_id": account_id,
+                "payment_month": payment_month,
+                "scheduled_payment_amount": amount,
+                "updated_at": now,
+            }
+            for payment_month, amount in amounts_by_month.items()
+        ],
+        conflict_columns=("user_id", "account_id", "payment_month"),
+        update_columns=("scheduled_payment_amount", "updated_at"),
+    )
     db.commit()
-    logger.info("debt_schedule.bulk_upserted", extra={"account_id": account_id, "count": len(new_schedules)})
-    return len(new_schedules)
+    logger.info("debt_schedule.bulk_upserted", extra={"account_id": account_id, "count": count})
+    return count
 
 def read_schedule_for_account(db: Session, user_id: int, account_id: int) -> List[DebtRepaymentScheduleDB]:
-    account = db.query(AccountDB).filter(AccountDB.db_id == account_id, AccountDB.user_id == user_id).first()
-    if not account:
-        raise NotFoundError("Account not found.")
-
-    return db.query(DebtRepaymentScheduleDB).options(
-        joinedload(DebtRepaymentScheduleDB.account),
+    # Ownership is enforced by the join; the existence check only runs when
+    # the schedule comes back empty.
+    schedules = db.query(DebtRepaymentScheduleDB).join(DebtRepaymentScheduleDB.account).options(
+        contains_eager(DebtRepaymentScheduleDB.account),
+        raiseload("*", sql_only=True),
     ).filter(
-        DebtRepaymentScheduleDB.account_id == account_id
+        DebtRepaymentScheduleDB.account_id == account_id,
+        AccountDB.user_id == user_id,
     ).order_by(DebtRepaymentScheduleDB.payment_month).all()
+    if not schedules and not db.query(
+        exists().where(AccountDB.db_id == account_id, AccountDB.user_id == user_id)
+    ).scalar():
+        raise NotFoundError("Account not found.")
+    return schedules
 
 # ===== INTEREST MATH HELPERS =====
 
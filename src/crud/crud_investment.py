@@ -1,9 +1,8 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, contains_eager, joinedload, raiseload
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import case, desc
+from sqlalchemy import case, desc, exists
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, date, timedelta
-from src.utils.time import utcnow
 from decimal import Decimal, ROUND_HALF_UP
 from uuid import UUID, uuid4
 import hashlib
@@ -21,7 +20,8 @@ from src.db.core import (
     NotFoundError,
     InvestmentTransactionType,
     SnapshotBackfillJobDB,
-    AccountType
+    AccountType,
+    existing_rows_by_hash,
 )
 from src.services.job_runner import get_job_runner
 from src.models.investment import (
@@ -38,27 +38,36 @@ from src.services.price_fetcher import is_option_symbol, parse_option_symbol
 # ===== DATABASE OPERATIONS - INVESTMENT HOLDINGS (READ-ONLY) =====
 
 def read_db_investment_holding(db: Session, holding_id: int, user_id: int) -> Optional[InvestmentHoldingDB]:
-    return db.query(InvestmentHoldingDB).join(AccountDB).options(
-        joinedload(InvestmentHoldingDB.account),
+    return db.query(InvestmentHoldingDB).join(InvestmentHoldingDB.account).options(
+        contains_eager(InvestmentHoldingDB.account),
     ).filter(
         InvestmentHoldingDB.db_id == holding_id,
         AccountDB.user_id == user_id
     ).first()
 
 def read_db_investment_holdings_by_account(db: Session, account_id: int, user_id: int) -> List[InvestmentHoldingDB]:
-    account = db.query(AccountDB).filter(AccountDB.db_id == account_id, AccountDB.user_id == user_id).first()
-    if not account:
+    # Ownership is enforced by the join, so the usual non-empty case is one
+    # query; only an empty result needs the follow-up to tell "no holdings"
+    # from "not your account".
+    holdings = db.query(InvestmentHoldingDB).join(InvestmentHoldingDB.account).options(
+        contains_eager(InvestmentHoldingDB.account),
+        raiseload("*", sql_only=True),
+    ).filter(
+        InvestmentHoldingDB.account_id == account_id,
+        AccountDB.user_id == user_id,
+    ).all()
+    if not holdings and not db.query(
+        exists().where(AccountDB.db_id == account_id, AccountDB.user_id == user_id)
+    ).scalar():
         raise NotFoundError(f"Account with id {account_id} not found.")
-    return db.query(InvestmentHoldingDB).options(
-        joinedload(InvestmentHoldingDB.account),
-    ).filter(InvestmentHoldingDB.account_id == account_id).all()
+    return holdings
 
 
 # ===== UUID-BASED OPERATIONS - HOLDINGS (READ-ONLY) =====
 
 def read_db_investment_holding_by_uuid(db: Session, holding_uuid: 'UUID', user_id: int) -> Optional[InvestmentHoldingDB]:
-    return db.query(InvestmentHoldingDB).join(AccountDB).options(
-        joinedload(InvestmentHoldingDB.account),
+    return db.query(InvestmentHoldingDB).join(InvestmentHoldingDB.account).options(
+        contains_eager(InvestmentHoldingDB.account),
     ).filter(
         InvestmentHoldingDB.uuid == holding_uuid,
         AccountDB.user_id == user_id
@@ -74,7 +83,6 @@ def update_db_investment_holding_by_uuid(db: Session, holding_uuid: 'UUID', user
     update_data = updates.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(holding, field, value)
-    holding.updated_at = utcnow()
     db.commit()
     db.refresh(holding)
     return holding
@@ -153,10 +161,15 @@ def rebuild_holdings_from_transactions(db: Session, account_id: int) -> List[Inv
     # holding_key -> InvestmentHoldingDB
     # Key is OCC symbol for options (e.g. "QQQ240524P00454000"), plain ticker otherwise ("QQQ")
     holdings_map: Dict[str, InvestmentHoldingDB] = {}
+    # holding_key -> security_type of the latest transaction that carried one,
+    # tracked during the replay rather than rescanning per holding afterwards
+    latest_security_type: Dict[str, str] = {}
 
     for txn in transactions:
         key = _holding_key(txn)
         txn_type = txn.transaction_type
+        if key and txn.security_type:
+            latest_security_type[key] = txn.security_type
 
         if txn_type in (InvestmentTransactionType.BUY, InvestmentTransactionType.REINVESTMENT):
             if not key:
@@ -249,14 +262,7 @@ def rebuild_holdings_from_transactions(db: Session, account_id: int) -> List[Inv
                 holding.expiration_date = date.fromisoformat(exp) if isinstance(exp, str) else exp
         else:
             # Use security_type from the most recent transaction for this holding
-            typed_txn = next(
-                (t for t in reversed(transactions) if _holding_key(t) == key and t.security_type),
-                None
-            )
-            if typed_txn:
-                holding.security_type = typed_txn.security_type
-            else:
-                holding.security_type = "STOCK"
+            holding.security_type = latest_security_type.get(key, "STOCK")
 
     # 6. Restore price cache
     for symbol, holding in holdings_map.items():
@@ -266,13 +272,16 @@ def rebuild_holdings_from_transactions(db: Session, account_id: int) -> List[Inv
 
     # 7. Remove fully-closed holdings (quantity == 0); keep open longs and shorts
     to_remove = [sym for sym, h in holdings_map.items() if h.quantity == 0]
+    closed_ids = set()
     for sym in to_remove:
         holding = holdings_map.pop(sym)
-        # Null out holding_id on transactions that reference this holding
+        closed_ids.add(holding.db_id)
+        db.delete(holding)
+    # Null out holding_id on transactions that reference a closed holding
+    if closed_ids:
         for txn in transactions:
-            if txn.holding_id == holding.db_id:
+            if txn.holding_id in closed_ids:
                 txn.holding_id = None
-        db.delete(holding)
 
     # 8. Flush — caller commits
     db.flush()
@@ -287,11 +296,10 @@ def _create_investment_transaction_no_rebuild(db: Session, user_id: int, transac
                                                account_id: int) -> InvestmentTransactionDB:
     """Create an investment transaction without triggering a holdings rebuild.
     Used internally by both single-create and bulk-create paths."""
-    account = db.query(AccountDB).filter(
-        AccountDB.db_id == account_id,
-        AccountDB.user_id == user_id
-    ).first()
-    if not account:
+    # Existence-only check: don't materialize the account row.
+    if not db.query(
+        exists().where(AccountDB.db_id == account_id, AccountDB.user_id == user_id)
+    ).scalar():
         raise NotFoundError(f"Account with id {account_id} not found.")
 
     # Generate transaction hash for deduplication
@@ -349,8 +357,9 @@ def create_db_investment_transaction(db: Session, user_id: int, transaction_data
     db_transaction = _create_investment_transaction_no_rebuild(db, user_id, transaction_data, account_id=account_id)
 
     try:
-        db.commit()
-        db.refresh(db_transaction)
+        # Flush (not commit) so the rebuild sees the new row and the
+        # transaction, holdings and balance land in one commit.
+        db.flush()
         rebuild_holdings_from_transactions(db, account_id)
         _update_investment_account_balance(db, account_id)
         db.commit()
@@ -512,18 +521,19 @@ def bulk_create_investment_transactions_from_parsed_data(
     skipped_duplicates = []
     duplicate_count = 0
 
-    # Pre-fetch all existing investment transaction hashes for this user to avoid flagging within-statement duplicates
-    existing_hashes_dict = {
-        t.transaction_hash: t for t in
-        db.query(InvestmentTransactionDB)
-        .filter(InvestmentTransactionDB.user_id == user_id)
-        .all()
-    }
+    # Generate transaction hashes for deduplication
+    hashed = [
+        (t_data, generate_investment_transaction_hash(t_data, user_id, account.db_id if account else 0, make_unique=account is None))
+        for t_data in transactions
+    ]
 
-    for t_data in transactions:
-        # Generate transaction hash for deduplication
-        transaction_hash = generate_investment_transaction_hash(t_data, user_id, account.db_id if account else 0, make_unique=account is None)
+    # Pre-fetch the existing rows matching this file's hashes (pre-upload
+    # snapshot) to avoid flagging within-statement duplicates
+    existing_hashes_dict = existing_rows_by_hash(
+        db, InvestmentTransactionDB, user_id, [transaction_hash for _, transaction_hash in hashed]
+    )
 
+    for t_data, transaction_hash in hashed:
         # Check if transaction hash existed in database BEFORE this upload
         existing_transaction = existing_hashes_dict.get(transaction_hash)
 
@@ -684,22 +694,21 @@ def bulk_create_investment_transactions(db: Session, user_id: int, bulk_data: In
     for transaction_data in bulk_data.transactions:
         acct_uuid_str = str(transaction_data.account_uuid)
         if acct_uuid_str not in account_id_map:
-            account = db.query(AccountDB).filter(
+            account_db_id = db.query(AccountDB.db_id).filter(
                 AccountDB.uuid == transaction_data.account_uuid,
                 AccountDB.user_id == user_id
-            ).first()
-            if not account:
+            ).scalar()
+            if account_db_id is None:
                 raise NotFoundError(f"Account not found for UUID {transaction_data.account_uuid}")
-            account_id_map[acct_uuid_str] = account.db_id
+            account_id_map[acct_uuid_str] = account_db_id
         acct_id = account_id_map[acct_uuid_str]
         db_txn = _create_investment_transaction_no_rebuild(db, user_id, transaction_data, account_id=acct_id)
         db_transactions.append(db_txn)
         affected_account_ids.add(acct_id)
 
     try:
-        db.commit()
-        for t in db_transactions:
-            db.refresh(t)
+        db.flush()
+        transaction_ids = [t.db_id for t in db_transactions]
         for acct_id in affected_account_ids:
             rebuild_holdings_from_transactions(db, acct_id)
             _update_investment_account_balance(db, acct_id)
@@ -709,19 +718,36 @@ def bulk_create_investment_transactions(db: Session, user_id: int, bulk_data: In
         logger.error(f"Bulk investment transaction creation failed: {e}")
         raise ValueError("Bulk investment transaction creation failed.")
 
+    # The commit expired every new row; reload them, with the account and
+    # holding the response reads, in one query rather than one per row.
+    if transaction_ids:
+        db.query(InvestmentTransactionDB).filter(
+            InvestmentTransactionDB.db_id.in_(transaction_ids)
+        ).options(
+            joinedload(InvestmentTransactionDB.account),
+            joinedload(InvestmentTransactionDB.holding),
+        ).all()
     return db_transactions
 
 def read_db_investment_transaction(db: Session, transaction_id: int, user_id: int) -> Optional[InvestmentTransactionDB]:
-    return db.query(InvestmentTransactionDB).join(AccountDB).filter(
+    return db.query(InvestmentTransactionDB).filter(
         InvestmentTransactionDB.db_id == transaction_id,
-        AccountDB.user_id == user_id
+        InvestmentTransactionDB.user_id == user_id
     ).first()
 
 def read_db_investment_transactions(db: Session, user_id: int, account_id: Optional[int] = None, skip: int = 0, limit: int = 100) -> List[InvestmentTransactionDB]:
-    query = db.query(InvestmentTransactionDB).join(AccountDB).options(
-        joinedload(InvestmentTransactionDB.account),
+    # The account join doubles as the account eager load (contains_eager),
+    # rather than joinedload adding a second, aliased join to accounts. Any
+    # other relationship touched while serializing the page raises instead of
+    # lazy-loading once per row. Ownership is filtered on the transaction's
+    # own user_id so the page can be read in order off
+    # idx_investment_transactions_user_date (or _account_date when an account
+    # is given) instead of sorting every matching row.
+    query = db.query(InvestmentTransactionDB).join(InvestmentTransactionDB.account).options(
+        contains_eager(InvestmentTransactionDB.account),
         joinedload(InvestmentTransactionDB.holding),
-    ).filter(AccountDB.user_id == user_id)
+        raiseload("*", sql_only=True),
+    ).filter(InvestmentTransactionDB.user_id == user_id)
     if account_id:
         query = query.filter(InvestmentTransactionDB.account_id == account_id)
 
@@ -741,15 +767,12 @@ def update_db_investment_transaction(db: Session, transaction_id: int, user_id:
         else:
             setattr(db_transaction, field, value)
 
-    db_transaction.updated_at = utcnow()
-
     try:
-        db.commit()
-        db.refresh(db_transaction)
+        db.flush()
         if account_id:
             rebuild_holdings_from_transactions(db, account_id)
             _update_investment_account_balance(db, account_id)
-            db.commit()
+        db.commit()
         return db_transaction
     except IntegrityError:
         db.rollback()
@@ -766,11 +789,11 @@ def delete_db_investment_transaction(db: Session, transaction_id: int, user_id:
 
     try:
         db.delete(db_transaction)
-        db.commit()
+        db.flush()
         if account_id:
             rebuild_holdings_from_transactions(db, account_id)
             _update_investment_account_balance(db, account_id)
-            db.commit()
+        db.commit()
 
         # Trigger snapshot recalculation from deleted transaction's date
         if account_id:
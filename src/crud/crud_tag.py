@@ -1,44 +1,74 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import desc
+from sqlalchemy import and_, desc, exists, func, select, Numeric, type_coerce
 from typing import Optional, List
 from datetime import datetime
 from src.utils.time import utcnow
 from uuid import UUID, uuid4
 
 # Import your database models
-from src.db.core import TagDB, UserDB, TransactionTagDB, TransactionDB, NotFoundError
+from src.db.core import TagDB, UserDB, TransactionTagDB, TransactionDB, NotFoundError, bulk_insert, bulk_insert_ignoring_conflicts
+from src.crud.crud_transaction import TRANSACTION_LIST_LOAD_OPTIONS
 from src.logging_config import get_logger
 from src.models.tag import TagCreate, TagUpdate, TagStats
 
 logger = get_logger(__name__)
 
+# TagStats reports amounts as floats, so stats reads take the summed driver
+# value as a float rather than building a Decimal only to convert it afterwards.
+# type_coerce changes result processing only; the emitted SQL is unchanged.
+_total_as_float = type_coerce(func.sum(TransactionDB.amount), Numeric(15, 2, asdecimal=False))
+
+# TagResponse reads only tag columns. List reads refuse any lazy load that
+# would emit SQL, so a relationship newly touched while serializing a page of
+# tags fails loudly in tests instead of costing one query per tag.
+TAG_LIST_LOAD_OPTIONS = (
+    raiseload("*", sql_only=True),
+)
+
+
+def _build_tag_stats(tag_uuid: UUID, tag_name: str, color: Optional[str], transaction_count: int,
+                     total_amount: Optional[float], most_recent_use) -> TagStats:
+    """Assemble TagStats from aggregated values (zero stats for an unused tag)
+
+    The values come from our own aggregate query, so the model is built with
+    model_construct and skips field validation. The driver does not always
+    hand back a float for the sum (SQLite returns an int for whole amounts),
+    so total_amount is coerced here rather than left to serialization."""
+    if not transaction_count:
+        return TagStats.model_construct(
+            id=tag_uuid,
+            tag_name=tag_name,
+            color=color,
+            transaction_count=0,
+            total_amount=0.0,
+            average_amount=0.0,
+            most_recent_use=None
+        )
+    total_amount = float(total_amount)
+    return TagStats.model_construct(
+        id=tag_uuid,
+        tag_name=tag_name,
+        color=color,
+        transaction_count=transaction_count,
+        total_amount=total_amount,
+        average_amount=total_amount / transaction_count,
+        most_recent_use=datetime.combine(most_recent_use, datetime.min.time())
+    )
+
 
 # ===== DATABASE OPERATIONS =====
 
 def create_db_tag(db: Session, user_id: int, tag_data: TagCreate) -> TagDB:
     """Create a new tag"""
     
-    # Verify user exists
-    user = db.query(UserDB).filter(UserDB.db_id == user_id).first()
-    if not user:
-        raise NotFoundError(f"User with id {user_id} not found")
-    
-    # Check for duplicate tag name for this user
-    existing_tag = db.query(TagDB).filter(
-        TagDB.user_id == user_id,
-        TagDB.tag_name.ilike(tag_data.tag_name.strip())
-    ).first()
-    if existing_tag:
-        raise ValueError(f"Tag with name '{tag_data.tag_name}' already exists")
-    
-    # Create new tag
+    # No lookups up front: uq_user_tag_name_ci rejects a case-insensitive
+    # duplicate name and the users FK rejects an unknown user.
     db_tag = TagDB(
         uuid=uuid4(),
         user_id=user_id,
         tag_name=tag_data.tag_name.strip(),
         color=tag_data.color,
-        created_at=utcnow()
     )
     
     try:
@@ -49,6 +79,19 @@ def create_db_tag(db: Session, user_id: int, tag_data: TagCreate) -> TagDB:
         return db_tag
     except IntegrityError:
         db.rollback()
+        # Only the failure path pays for finding out which constraint fired,
+        # in one query
+        user_exists, name_taken = db.query(
+            exists().where(UserDB.db_id == user_id),
+            exists().where(
+                TagDB.user_id == user_id,
+                func.lower(TagDB.tag_name) == func.lower(db_tag.tag_name),
+            ),
+        ).one()
+        if not user_exists:
+            raise NotFoundError(f"User with id {user_id} not found")
+        if name_taken:
+            raise ValueError(f"Tag with name '{tag_data.tag_name}' already exists")
         logger.error("tag.create_failed", extra={"reason": "integrity_error"})
         raise ValueError("Tag creation failed due to database constraint")
 
@@ -68,41 +111,54 @@ def read_db_tags(db: Session, user_id: int, skip: int = 0, limit: int = 100,
                 include_transaction_count: bool = False) -> List[TagDB]:
     """Read all tags for a user"""
     
-    query = db.query(TagDB).filter(TagDB.user_id == user_id)
-    
     if include_transaction_count:
-        # This would require a more complex query with joins and counts
-        # For now, we'll fetch tags and add counts separately if needed
-        pass
-    
+        # Counts come back with the page from one LEFT JOIN + GROUP BY and are
+        # attached to each tag for TagResponse.transaction_count.
+        rows = (
+            db.query(TagDB, func.count(TransactionTagDB.transaction_id))
+            .outerjoin(TransactionTagDB, TransactionTagDB.tag_id == TagDB.db_id)
+            .filter(TagDB.user_id == user_id)
+            .group_by(TagDB.db_id)
+            .order_by(TagDB.tag_name)
+            .options(*TAG_LIST_LOAD_OPTIONS)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        tags = []
+        for tag, transaction_count in rows:
+            tag.transaction_count = transaction_count
+            tags.append(tag)
+        return tags
+
+    query = db.query(TagDB).filter(TagDB.user_id == user_id)
     query = query.order_by(TagDB.tag_name)
-    return query.offset(skip).limit(limit).all()
+    return query.options(*TAG_LIST_LOAD_OPTIONS).offset(skip).limit(limit).all()
+
+
+def _get_owned_tag(db: Session, tag_id: int, user_id: int) -> Optional[TagDB]:
+    """Fetch a tag by primary key through the session's identity map.
+
+    The session lives for one request, so when the router or a *_by_uuid
+    wrapper has already loaded this tag, ``Session.get`` returns it without
+    another SELECT. Ownership is then checked on the loaded row."""
+    db_tag = db.get(TagDB, tag_id)
+    if db_tag is None or db_tag.user_id != user_id:
+        return None
+    return db_tag
 
 
 def update_db_tag(db: Session, tag_id: int, user_id: int, tag_updates: TagUpdate) -> TagDB:
     """Update an existing tag"""
     
     # Get the existing tag
-    db_tag = db.query(TagDB).filter(
-        TagDB.db_id == tag_id,
-        TagDB.user_id == user_id
-    ).first()
-    
+    db_tag = _get_owned_tag(db, tag_id, user_id)
     if not db_tag:
         raise NotFoundError(f"Tag with id {tag_id} not found")
     
-    # Check for duplicate tag name if name is being updated
+    # Update the tag. A rename onto another tag's name (in any case) is
+    # rejected by uq_user_tag_name_ci at commit rather than looked up first.
     update_data = tag_updates.model_dump(exclude_unset=True)
-    if 'tag_name' in update_data:
-        existing_tag = db.query(TagDB).filter(
-            TagDB.user_id == user_id,
-            TagDB.tag_name.ilike(update_data['tag_name'].strip()),
-            TagDB.db_id != tag_id
-        ).first()
-        if existing_tag:
-            raise ValueError(f"Tag with name '{update_data['tag_name']}' already exists")
-    
-    # Update the tag
     for field, value in update_data.items():
         setattr(db_tag, field, value)
     
@@ -113,6 +169,8 @@ def update_db_tag(db: Session, tag_id: int, user_id: int, tag_updates: TagUpdate
         return db_tag
     except IntegrityError:
         db.rollback()
+        if 'tag_name' in update_data:
+            raise ValueError(f"Tag with name '{update_data['tag_name']}' already exists")
         logger.error("tag.update_failed", extra={"resource_id": tag_id, "reason": "integrity_error"})
         raise ValueError("Tag update failed due to database constraint")
 
@@ -120,125 +178,114 @@ def update_db_tag(db: Session, tag_id: int, user_id: int, tag_updates: TagUpdate
 def delete_db_tag(db: Session, tag_id: int, user_id: int) -> bool:
     """Delete a tag and all its transaction associations"""
     
-    db_tag = db.query(TagDB).filter(
-        TagDB.db_id == tag_id,
-        TagDB.user_id == user_id
-    ).first()
-    
-    if not db_tag:
-        raise NotFoundError(f"Tag with id {tag_id} not found")
-    
+    # Two bulk DELETEs, both guarded by ownership; nothing is loaded first and
+    # the ORM never walks TagDB.transaction_tags to null out child rows.
+    owned_tag = select(TagDB.db_id).where(TagDB.db_id == tag_id, TagDB.user_id == user_id)
     try:
-        # First delete all transaction-tag relationships
-        db.query(TransactionTagDB).filter(TransactionTagDB.tag_id == tag_id).delete()
-        
-        # Then delete the tag
-        db.delete(db_tag)
-        db.commit()
-        logger.info("tag.deleted", extra={"resource_id": tag_id})
-        return True
+        db.query(TransactionTagDB).filter(
+            TransactionTagDB.tag_id.in_(owned_tag)
+        ).delete(synchronize_session=False)
+        deleted = db.query(TagDB).filter(
+            TagDB.db_id == tag_id,
+            TagDB.user_id == user_id
+        ).delete(synchronize_session='evaluate')
     except Exception as e:
         db.rollback()
         logger.error("tag.delete_failed", extra={"resource_id": tag_id}, exc_info=True)
         raise ValueError(f"Failed to delete tag: {str(e)}")
+    
+    if not deleted:
+        db.rollback()
+        raise NotFoundError(f"Tag with id {tag_id} not found")
+    
+    db.commit()
+    logger.info("tag.deleted", extra={"resource_id": tag_id})
+    return True
 
 
-def add_tag_to_transaction(db: Session, user_id: int, transaction_id: int, tag_id: int) -> TransactionTagDB:
-    """Add a tag to a transaction"""
-    
-    # Verify transaction belongs to user
-    transaction = db.query(TransactionDB).filter(
-        TransactionDB.db_id == transaction_id,
-        TransactionDB.user_id == user_id
-    ).first()
-    if not transaction:
+def _user_owns_transaction(db: Session, transaction_id: int, user_id: int) -> bool:
+    """Ownership check as a single EXISTS; the row itself is never loaded"""
+    return db.query(
+        exists().where(TransactionDB.db_id == transaction_id, TransactionDB.user_id == user_id)
+    ).scalar()
+
+
+def _user_owns_tag(db: Session, tag_id: int, user_id: int) -> bool:
+    """Ownership check as a single EXISTS; the row itself is never loaded"""
+    return db.query(
+        exists().where(TagDB.db_id == tag_id, TagDB.user_id == user_id)
+    ).scalar()
+
+
+def _verify_tag_link_ownership(db: Session, user_id: int, transaction_id: int, tag_id: int) -> None:
+    """Check the transaction and the tag both belong to the user, in one query"""
+    transaction_owned, tag_owned = db.query(
+        exists().where(TransactionDB.db_id == transaction_id, TransactionDB.user_id == user_id),
+        exists().where(TagDB.db_id == tag_id, TagDB.user_id == user_id),
+    ).one()
+    if not transaction_owned:
         raise NotFoundError(f"Transaction with id {transaction_id} not found")
-    
-    # Verify tag belongs to user
-    tag = db.query(TagDB).filter(
-        TagDB.db_id == tag_id,
-        TagDB.user_id == user_id
-    ).first()
-    if not tag:
+    if not tag_owned:
         raise NotFoundError(f"Tag with id {tag_id} not found")
-    
-    # Check if relationship already exists
-    existing_relationship = db.query(TransactionTagDB).filter(
-        TransactionTagDB.transaction_id == transaction_id,
-        TransactionTagDB.tag_id == tag_id
-    ).first()
-    if existing_relationship:
-        raise ValueError("Transaction is already tagged with this tag")
-    
-    # Create the relationship
-    db_transaction_tag = TransactionTagDB(
-        transaction_id=transaction_id,
-        tag_id=tag_id,
-        created_at=utcnow()
+
+
+def _link_tag(db: Session, transaction_id: int, tag_id: int) -> TransactionTagDB:
+    """Insert the transaction-tag pair; a pair that already exists is skipped by
+    the composite primary key and reported as a duplicate"""
+    inserted = bulk_insert_ignoring_conflicts(
+        db,
+        TransactionTagDB,
+        [{"transaction_id": transaction_id, "tag_id": tag_id}],
+        ("transaction_id", "tag_id"),
     )
-    
-    try:
-        db.add(db_transaction_tag)
-        db.commit()
-        db.refresh(db_transaction_tag)
-        return db_transaction_tag
-    except IntegrityError:
+    if not inserted:
         db.rollback()
-        raise ValueError("Failed to add tag to transaction")
+        raise ValueError("Transaction is already tagged with this tag")
+    db.commit()
+    return db.get(TransactionTagDB, (transaction_id, tag_id))
 
 
-def remove_tag_from_transaction(db: Session, user_id: int, transaction_id: int, tag_id: int) -> bool:
-    """Remove a tag from a transaction"""
-    
-    # Verify transaction belongs to user
-    transaction = db.query(TransactionDB).filter(
-        TransactionDB.db_id == transaction_id,
-        TransactionDB.user_id == user_id
-    ).first()
-    if not transaction:
-        raise NotFoundError(f"Transaction with id {transaction_id} not found")
-    
-    # Verify tag belongs to user
-    tag = db.query(TagDB).filter(
-        TagDB.db_id == tag_id,
-        TagDB.user_id == user_id
-    ).first()
-    if not tag:
-        raise NotFoundError(f"Tag with id {tag_id} not found")
-    
-    # Find and delete the relationship
-    transaction_tag = db.query(TransactionTagDB).filter(
-        TransactionTagDB.transaction_id == transaction_id,
-        TransactionTagDB.tag_id == tag_id
-    ).first()
-    
-    if not transaction_tag:
-        raise NotFoundError("Transaction tag relationship not found")
-    
+def _unlink_tag(db: Session, transaction_id: int, tag_id: int) -> bool:
+    """Delete the transaction-tag pair"""
     try:
-        db.delete(transaction_tag)
-        db.commit()
-        return True
+        deleted = db.query(TransactionTagDB).filter(
+            TransactionTagDB.transaction_id == transaction_id,
+            TransactionTagDB.tag_id == tag_id
+        ).delete(synchronize_session='fetch')
     except Exception as e:
         db.rollback()
         raise ValueError(f"Failed to remove tag from transaction: {str(e)}")
+    if not deleted:
+        raise NotFoundError("Transaction tag relationship not found")
+    db.commit()
+    return True
+
+
+def add_tag_to_transaction(db: Session, user_id: int, transaction_id: int, tag_id: int) -> TransactionTagDB:
+    """Add a tag to a transaction"""
+    
+    _verify_tag_link_ownership(db, user_id, transaction_id, tag_id)
+    return _link_tag(db, transaction_id, tag_id)
+
+
+def remove_tag_from_transaction(db: Session, user_id: int, transaction_id: int, tag_id: int) -> bool:
+    """Remove a tag from a transaction"""
+    
+    _verify_tag_link_ownership(db, user_id, transaction_id, tag_id)
+    return _unlink_tag(db, transaction_id, tag_id)
 
 
 def get_tags_for_transaction(db: Session, transaction_id: int, user_id: int) -> List[TagDB]:
     """Get all tags for a specific transaction"""
     
     # Verify transaction belongs to user
-    transaction = db.query(TransactionDB).filter(
-        TransactionDB.db_id == transaction_id,
-        TransactionDB.user_id == user_id
-    ).first()
-    if not transaction:
+    if not _user_owns_transaction(db, transaction_id, user_id):
         raise NotFoundError(f"Transaction with id {transaction_id} not found")
     
     tags = db.query(TagDB).join(TransactionTagDB).filter(
         TransactionTagDB.transaction_id == transaction_id,
         TagDB.user_id == user_id
-    ).order_by(TagDB.tag_name).all()
+    ).options(*TAG_LIST_LOAD_OPTIONS).order_by(TagDB.tag_name).all()
     
     return tags
 
@@ -247,87 +294,59 @@ def get_transactions_for_tag(db: Session, tag_id: int, user_id: int, skip: int =
     """Get all transactions for a specific tag"""
     
     # Verify tag belongs to user
-    tag = db.query(TagDB).filter(
-        TagDB.db_id == tag_id,
-        TagDB.user_id == user_id
-    ).first()
-    if not tag:
+    if not _user_owns_tag(db, tag_id, user_id):
         raise NotFoundError(f"Tag with id {tag_id} not found")
     
     transactions = db.query(TransactionDB).join(TransactionTagDB).filter(
         TransactionTagDB.tag_id == tag_id,
         TransactionDB.user_id == user_id
-    ).order_by(desc(TransactionDB.transaction_date)).offset(skip).limit(limit).all()
+    ).options(*TRANSACTION_LIST_LOAD_OPTIONS).order_by(
+        # db_id breaks same-day ties so OFFSET pages don't overlap or skip rows
+        desc(TransactionDB.transaction_date), desc(TransactionDB.db_id)
+    ).offset(skip).limit(limit).all()
     
     return transactions
 
 
+def _tag_stats_query(db: Session, user_id: int):
+    """Per-tag count/sum/latest-date for the user's tags, aggregated in SQL.
+    The outer joins keep unused tags (count 0)."""
+    return db.query(
+        TagDB.uuid,
+        TagDB.tag_name,
+        TagDB.color,
+        func.count(TransactionDB.db_id),
+        _total_as_float,
+        func.max(TransactionDB.transaction_date),
+    ).outerjoin(
+        TransactionTagDB, TransactionTagDB.tag_id == TagDB.db_id
+    ).outerjoin(
+        TransactionDB, and_(
+            TransactionDB.db_id == TransactionTagDB.transaction_id,
+            TransactionDB.user_id == user_id
+        )
+    ).filter(
+        TagDB.user_id == user_id
+    ).group_by(TagDB.db_id)
+
+
 def get_tag_stats(db: Session, tag_id: int, user_id: int) -> TagStats:
     """Get statistics for a specific tag"""
     
-    # Verify tag belongs to user
-    tag = db.query(TagDB).filter(
-        TagDB.db_id == tag_id,
-        TagDB.user_id == user_id
-    ).first()
-    if not tag:
+    # Ownership and aggregation in one statement; no row for a tag the user
+    # doesn't own
+    row = _tag_stats_query(db, user_id).filter(TagDB.db_id == tag_id).first()
+    if not row:
         raise NotFoundError(f"Tag with id {tag_id} not found")
     
-    # Get all transactions for this tag
-    transactions = db.query(TransactionDB).join(TransactionTagDB).filter(
-        TransactionTagDB.tag_id == tag_id,
-        TransactionDB.user_id == user_id
-    ).all()
-    
-    if not transactions:
-        return TagStats(
-            id=tag.uuid,
-            tag_name=tag.tag_name,
-            color=tag.color,
-            transaction_count=0,
-            total_amount=0.0,
-            average_amount=0.0,
-            most_recent_use=None
-        )
-    
-    total_amount = sum(float(t.amount) for t in transactions)
-    average_amount = total_amount / len(transactions)
-    most_recent_use = max(t.transaction_date for t in transactions)
-    
-    return TagStats(
-        id=tag.uuid,
-        tag_name=tag.tag_name,
-        color=tag.color,
-        transaction_count=len(transactions),
-        total_amount=total_amount,
-        average_amount=average_amount,
-        most_recent_use=datetime.combine(most_recent_use, datetime.min.time())
-    )
+    return _build_tag_stats(*row)
 
 
 def get_all_tag_stats(db: Session, user_id: int) -> List[TagStats]:
     """Get statistics for all user tags"""
     
-    tags = db.query(TagDB).filter(TagDB.user_id == user_id).all()
-    
-    stats = []
-    for tag in tags:
-        try:
-            tag_stats = get_tag_stats(db, tag.db_id, user_id)
-            stats.append(tag_stats)
-        except Exception:
-            # If we can't get stats for a tag, include it with zero stats
-            stats.append(TagStats(
-                id=tag.uuid,
-                tag_name=tag.tag_name,
-                color=tag.color,
-                transaction_count=0,
-                total_amount=0.0,
-                average_amount=0.0,
-                most_recent_use=None
-            ))
-    
-    return stats
+    rows = _tag_stats_query(db, user_id).order_by(TagDB.db_id).all()
+    return [_build_tag_stats(*row) for row in rows]
 
 
 def search_tags(db: Session, user_id: int, search_term: str) -> List[TagDB]:
@@ -336,7 +355,7 @@ def search_tags(db: Session, user_id: int, search_term: str) -> List[TagDB]:
     return db.query(TagDB).filter(
         TagDB.user_id == user_id,
         TagDB.tag_name.ilike(f"%{search_term}%")
-    ).order_by(TagDB.tag_name).all()
+    ).options(*TAG_LIST_LOAD_OPTIONS).order_by(TagDB.tag_name).all()
 
 
 def read_db_tag_by_uuid(db: Session, tag_uuid: UUID, user_id: int) -> Optional[TagDB]:
@@ -369,10 +388,10 @@ def delete_db_tag_by_uuid(db: Session, tag_uuid: UUID, user_id: int) -> bool:
 
 def get_tag_stats_by_uuid(db: Session, tag_uuid: UUID, user_id: int) -> TagStats:
     """Get tag stats by UUID"""
-    db_tag = read_db_tag_by_uuid(db, tag_uuid, user_id)
-    if not db_tag:
+    row = _tag_stats_query(db, user_id).filter(TagDB.uuid == tag_uuid).first()
+    if not row:
         raise NotFoundError(f"Tag not found")
-    return get_tag_stats(db, db_tag.db_id, user_id)
+    return _build_tag_stats(*row)
 
 def get_transactions_for_tag_by_uuid(db: Session, tag_uuid: UUID, user_id: int, skip: int = 0, limit: int = 100) -> List[TransactionDB]:
     """Get transactions for a tag identified by UUID"""
@@ -381,90 +400,71 @@ def get_transactions_for_tag_by_uuid(db: Session, tag_uuid: UUID, user_id: int,
         raise NotFoundError(f"Tag not found")
     return get_transactions_for_tag(db, db_tag.db_id, user_id, skip, limit)
 
-def add_tag_to_transaction_by_uuids(db: Session, user_id: int, transaction_uuid: UUID, tag_uuid: UUID) -> TransactionTagDB:
-    """Add a tag to a transaction using UUIDs"""
-    transaction = db.query(TransactionDB).filter(
+def _resolve_tag_link_ids(db: Session, user_id: int, transaction_uuid: UUID, tag_uuid: UUID) -> tuple[int, int]:
+    """Resolve an owned transaction and tag UUID pair to their ids (ids only, no entities)"""
+    transaction_id = db.query(TransactionDB.db_id).filter(
         TransactionDB.uuid == transaction_uuid,
         TransactionDB.user_id == user_id
-    ).first()
-    if not transaction:
+    ).scalar()
+    if transaction_id is None:
         raise NotFoundError(f"Transaction not found")
-    tag = read_db_tag_by_uuid(db, tag_uuid, user_id)
-    if not tag:
+    tag_id = db.query(TagDB.db_id).filter(
+        TagDB.uuid == tag_uuid,
+        TagDB.user_id == user_id
+    ).scalar()
+    if tag_id is None:
         raise NotFoundError(f"Tag not found")
-    return add_tag_to_transaction(db, user_id, transaction.db_id, tag.db_id)
+    return transaction_id, tag_id
+
+def add_tag_to_transaction_by_uuids(db: Session, user_id: int, transaction_uuid: UUID, tag_uuid: UUID) -> TransactionTagDB:
+    """Add a tag to a transaction using UUIDs"""
+    # Ownership is established by the UUID lookups; no need to re-verify by id
+    return _link_tag(db, *_resolve_tag_link_ids(db, user_id, transaction_uuid, tag_uuid))
 
 def remove_tag_from_transaction_by_uuids(db: Session, user_id: int, transaction_uuid: UUID, tag_uuid: UUID) -> bool:
     """Remove a tag from a transaction using UUIDs"""
-    transaction = db.query(TransactionDB).filter(
-        TransactionDB.uuid == transaction_uuid,
-        TransactionDB.user_id == user_id
-    ).first()
-    if not transaction:
-        raise NotFoundError(f"Transaction not found")
-    tag = read_db_tag_by_uuid(db, tag_uuid, user_id)
-    if not tag:
-        raise NotFoundError(f"Tag not found")
-    return remove_tag_from_transaction(db, user_id, transaction.db_id, tag.db_id)
+    return _unlink_tag(db, *_resolve_tag_link_ids(db, user_id, transaction_uuid, tag_uuid))
 
 
-def bulk_tag_transactions(db: Session, user_id: int, transaction_ids: List[int], tag_id: int) -> List[TransactionTagDB]:
-    """Add the same tag to multiple transactions"""
+def bulk_tag_transactions(db: Session, user_id: int, transaction_ids: List[int], tag_id: int) -> int:
+    """Add the same tag to multiple transactions. Returns the number newly tagged."""
     
     # Verify tag belongs to user
-    tag = db.query(TagDB).filter(
-        TagDB.db_id == tag_id,
-        TagDB.user_id == user_id
-    ).first()
-    if not tag:
+    if not _user_owns_tag(db, tag_id, user_id):
         raise NotFoundError(f"Tag with id {tag_id} not found")
     
-    # Verify all transactions belong to user
-    transactions = db.query(TransactionDB).filter(
-        TransactionDB.db_id.in_(transaction_ids),
-        TransactionDB.user_id == user_id
-    ).all()
-    
-    if len(transactions) != len(transaction_ids):
-        raise ValueError("One or more transactions not found or don't belong to user")
-    
-    created_relationships = []
-    errors = []
-    
-    for transaction_id in transaction_ids:
-        try:
-            # Check if relationship already exists
-            existing = db.query(TransactionTagDB).filter(
-                TransactionTagDB.transaction_id == transaction_id,
-                TransactionTagDB.tag_id == tag_id
-            ).first()
-            
-            if existing:
-                continue  # Skip if already tagged
-            
-            # Create relationship
-            db_transaction_tag = TransactionTagDB(
-                transaction_id=transaction_id,
-                tag_id=tag_id,
-                created_at=utcnow()
-            )
-            
-            db.add(db_transaction_tag)
-            created_relationships.append(db_transaction_tag)
-            
-        except Exception as e:
-            errors.append({
-                'transaction_id': transaction_id,
-                'error': str(e)
-            })
+    # Verify all transactions belong to user. Only the id column is selected,
+    # so no TransactionDB rows are built and the error can name the misses.
+    transaction_ids = list(dict.fromkeys(transaction_ids))
+    owned = set(db.scalars(select(TransactionDB.db_id).where(
+        TransactionDB.user_id == user_id,
+        TransactionDB.db_id.in_(transaction_ids)
+    )))
+    missing = set(transaction_ids) - owned
+    if missing:
+        raise ValueError(f"Transactions not found or not owned by user: {sorted(missing)}")
+    
+    # One lookup for the pairs that already exist, then one batched INSERT for
+    # the rest, instead of a SELECT and an ORM add per transaction
+    already_tagged = {
+        transaction_id for (transaction_id,) in db.query(TransactionTagDB.transaction_id).filter(
+            TransactionTagDB.tag_id == tag_id,
+            TransactionTagDB.transaction_id.in_(transaction_ids)
+        )
+    }
+    # One timestamp for the whole batch rather than the column default
+    # evaluating utcnow() once per row
+    now = utcnow()
+    rows = [
+        {"transaction_id": transaction_id, "tag_id": tag_id, "created_at": now}
+        for transaction_id in transaction_ids
+        if transaction_id not in already_tagged
+    ]
     
     try:
-        if created_relationships:
-            db.commit()
-            for relationship in created_relationships:
-                db.refresh(relationship)
-        
-        return created_relationships
+        count = bulk_insert(db, TransactionTagDB, rows)
+        db.commit()
+        return count
         
     except Exception as e:
         db.rollback()
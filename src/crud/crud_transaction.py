@@ -1,8 +1,8 @@
 from collections import defaultdict
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_, or_, desc, asc, exists, select, func
+from sqlalchemy import and_, or_, desc, asc, case, exists, insert, select, func, tuple_
 from typing import Optional, List, Dict, Any, Set, Tuple
 from datetime import datetime, date
 from src.utils.time import utcnow
@@ -11,7 +11,7 @@ from uuid import uuid4, UUID
 import hashlib
 
 # Import your database models
-from src.db.core import TransactionDB, AccountDB, UserDB, NotFoundError, TransactionType, SourceType, CategoryDB, TransactionRelationshipDB, RelationshipType, TagDB, TransactionTagDB, AccountType, TransactionSplitAllocationDB, TransactionAmortizationScheduleDB
+from src.db.core import existing_hashes, existing_rows_by_hash, TransactionDB, AccountDB, UserDB, NotFoundError, TransactionType, SourceType, CategoryDB, TransactionRelationshipDB, RelationshipType, TagDB, TransactionTagDB, AccountType, TransactionSplitAllocationDB, TransactionAmortizationScheduleDB
 from src.models.transaction import (
     TransactionCreate, TransactionUpdate, TransactionFilter, TransactionStats,
     TransactionImport, TransactionSplitRequest, AmortizationScheduleCreate,
@@ -20,7 +20,7 @@ from src.models.transaction import (
     MonthlyAverageSubcategoryBreakdown, MonthlyAverageMonthBreakdown,
 )
 from src.parser.models import ParsedTransaction
-from src.crud.crud_account import update_account_balance
+from src.crud.crud_account import adjust_account_balance
 from src.crud.crud_category import read_db_categories_by_uuids
 from src.services.system_tags import get_system_tag
 from src.logging_config import get_logger
@@ -35,6 +35,28 @@ ABSORBING_RELATIONSHIP_TYPES = {
 }
 
 
+# Loader options covering everything TransactionResponse serializes (including
+# CategoryResponse's parent uuid). Many-to-one parents are joined into the main
+# row; collections use selectinload (one IN-query each) so a LIMIT/OFFSET page
+# isn't wrapped in a joined subquery and row-multiplied by tags x splits.
+TRANSACTION_RESPONSE_LOAD_OPTIONS = (
+    joinedload(TransactionDB.category).joinedload(CategoryDB.parent),
+    joinedload(TransactionDB.subcategory).joinedload(CategoryDB.parent),
+    joinedload(TransactionDB.account),
+    selectinload(TransactionDB.transaction_tags).joinedload(TransactionTagDB.tag),
+    selectinload(TransactionDB.split_allocations).joinedload(TransactionSplitAllocationDB.category),
+    selectinload(TransactionDB.split_allocations).joinedload(TransactionSplitAllocationDB.subcategory),
+)
+
+# List endpoints additionally refuse any other lazy load that would emit SQL,
+# so a relationship newly touched during serialization fails loudly in tests
+# instead of silently costing one query per row.
+TRANSACTION_LIST_LOAD_OPTIONS = (
+    *TRANSACTION_RESPONSE_LOAD_OPTIONS,
+    raiseload("*", sql_only=True),
+)
+
+
 # ===== REFUND ATTRIBUTION =====
 
 def get_refund_adjustments(
@@ -51,7 +73,13 @@ def get_refund_adjustments(
     """
     if not transaction_ids:
         return {}, set()
+    return _refund_adjustments_for(db, transaction_ids)
+
 
+def _refund_adjustments_for(db: Session, transaction_ids) -> Tuple[Dict[int, Decimal], Set[int]]:
+    """Body of ``get_refund_adjustments``. ``transaction_ids`` may also be a
+    query selecting ids, so a filtered set is matched inside the database
+    instead of shipping every id to Python first."""
     relationships = (
         db.query(TransactionRelationshipDB)
         .filter(
@@ -221,23 +249,31 @@ def get_original_transaction_for_duplicate(
 
 # ===== DATABASE OPERATIONS =====
 
+def _get_owned_account(db: Session, account_id: int, user_id: int) -> Optional[AccountDB]:
+    """Fetch an account by primary key through the session's identity map.
+
+    Routers resolve the account UUID before calling into this module, and the
+    session lives for one request, so ``Session.get`` usually returns that
+    already-loaded row without another SELECT. Ownership is checked on it."""
+    account = db.get(AccountDB, account_id)
+    if account is None or account.user_id != user_id:
+        return None
+    return account
+
+
 def create_db_transaction(db: Session, user_id: int, transaction_data: TransactionCreate, *,
                           account_id: Optional[int] = None, category_id: Optional[int] = None,
                           subcategory_id: Optional[int] = None) -> TransactionDB:
     """Create a new transaction"""
 
     # Verify user exists
-    user = db.query(UserDB).filter(UserDB.db_id == user_id).first()
-    if not user:
+    if db.get(UserDB, user_id) is None:
         raise NotFoundError(f"User with id {user_id} not found")
 
     account = None
     if account_id:
         # Verify account exists and belongs to user
-        account = db.query(AccountDB).filter(
-            AccountDB.db_id == account_id,
-            AccountDB.user_id == user_id
-        ).first()
+        account = _get_owned_account(db, account_id, user_id)
         if not account:
             raise NotFoundError(f"Account with id {account_id} not found")
 
@@ -298,13 +334,11 @@ def create_db_transaction(db: Session, user_id: int, transaction_data: Transacti
 
     try:
         db.add(db_transaction)
+        if account:
+            update_account_balance_from_transaction(db, account, db_transaction)
         db.commit()
         db.refresh(db_transaction)
 
-        if account:
-            # Update account balance (you might want to do this in a separate service)
-            update_account_balance_from_transaction(db, account, db_transaction)
-        
         return db_transaction
     except IntegrityError:
         db.rollback()
@@ -444,14 +478,21 @@ def read_db_transaction_by_uuid(db: Session, transaction_uuid: UUID, user_id: Op
     if user_id:
         query = query.filter(TransactionDB.user_id == user_id)
 
-    return query.options(
-        joinedload(TransactionDB.category),
-        joinedload(TransactionDB.subcategory),
-        joinedload(TransactionDB.account),
-        joinedload(TransactionDB.transaction_tags).joinedload(TransactionTagDB.tag),
-        joinedload(TransactionDB.split_allocations).joinedload(TransactionSplitAllocationDB.category),
-        joinedload(TransactionDB.split_allocations).joinedload(TransactionSplitAllocationDB.subcategory),
-    ).first()
+    return query.options(*TRANSACTION_RESPONSE_LOAD_OPTIONS).first()
+
+
+def read_db_transaction_ids_by_uuids(db: Session, transaction_uuids: List[UUID], user_id: int) -> Dict[UUID, int]:
+    """Map the user's transaction UUIDs to their int IDs in one query.
+
+    Selects only the two key columns, so callers that just need IDs don't
+    load full transactions. UUIDs that are missing or owned by another user
+    are absent from the result."""
+    return dict(db.execute(
+        select(TransactionDB.uuid, TransactionDB.db_id).where(
+            TransactionDB.user_id == user_id,
+            TransactionDB.uuid.in_(transaction_uuids),
+        )
+    ).all())
 
 
 def _apply_transaction_filters(query, filters: TransactionFilter):
@@ -524,33 +565,48 @@ def _apply_transaction_filters(query, filters: TransactionFilter):
 
 def read_db_transactions(db: Session, user_id: int, filters: Optional[TransactionFilter] = None,
                         skip: int = 0, limit: int = 100, order_by: str = "transaction_date",
-                        order_desc: bool = True) -> List[TransactionDB]:
-    """Read transactions with filtering and pagination"""
+                        order_desc: bool = True,
+                        after: Optional[Tuple[date, int]] = None) -> List[TransactionDB]:
+    """Read transactions with filtering and pagination.
+
+    ``after`` is a keyset cursor: the ``(transaction_date, db_id)`` of the last
+    row of the previous page. The page then starts right after that row via
+    an index range read, instead of OFFSET walking past every earlier row.
+    Only valid with the default ``transaction_date`` ordering."""
 
     query = db.query(TransactionDB).filter(TransactionDB.user_id == user_id)
 
     if filters:
         query = _apply_transaction_filters(query, filters)
 
-    # Apply ordering
+    direction = desc if order_desc else asc
+
+    # Apply ordering; db_id breaks ties so pages are deterministic
     if hasattr(TransactionDB, order_by):
         order_column = getattr(TransactionDB, order_by)
-        if order_desc:
-            query = query.order_by(desc(order_column))
-        else:
-            query = query.order_by(asc(order_column))
     else:
         # Default ordering
-        query = query.order_by(desc(TransactionDB.transaction_date))
-    
-    return query.options(
-        joinedload(TransactionDB.category),
-        joinedload(TransactionDB.subcategory),
-        joinedload(TransactionDB.account),
-        joinedload(TransactionDB.transaction_tags).joinedload(TransactionTagDB.tag),
-        joinedload(TransactionDB.split_allocations).joinedload(TransactionSplitAllocationDB.category),
-        joinedload(TransactionDB.split_allocations).joinedload(TransactionSplitAllocationDB.subcategory),
-    ).offset(skip).limit(limit).all()
+        order_column = TransactionDB.transaction_date
+        direction = desc
+    query = query.order_by(direction(order_column), direction(TransactionDB.db_id))
+
+    if after is not None:
+        if order_column is not TransactionDB.transaction_date:
+            raise ValueError("Cursor pagination is only supported when ordering by transaction_date")
+        key = tuple_(TransactionDB.transaction_date, TransactionDB.db_id)
+        query = query.filter(key < tuple_(*after) if direction is desc else key > tuple_(*after))
+
+    return query.options(*TRANSACTION_LIST_LOAD_OPTIONS).offset(skip).limit(limit).all()
+
+
+def read_transaction_page_cursor(db: Session, user_id: int, transaction_uuid: UUID) -> Optional[Tuple[date, int]]:
+    """Resolve a transaction UUID to the ``(transaction_date, db_id)`` keyset
+    cursor that ``read_db_transactions(after=...)`` pages from."""
+    row = db.query(TransactionDB.transaction_date, TransactionDB.db_id).filter(
+        TransactionDB.uuid == transaction_uuid,
+        TransactionDB.user_id == user_id,
+    ).first()
+    return tuple(row) if row else None
 
 
 def update_db_transaction(db: Session, transaction_id: int, user_id: int,
@@ -580,24 +636,27 @@ def update_db_transaction(db: Session, transaction_id: int, user_id: int,
     )
 
     try:
-        db.commit()
-        db.refresh(db_transaction)
-
-        # Update account balances if amount or account changed
+        # Update account balances if amount or account changed, in the same
+        # commit as the edit itself
         amount_changed = 'amount' in update_data and update_data['amount'] != old_amount
         account_changed = old_account_id != db_transaction.account_id
 
         if amount_changed or account_changed:
             # Reverse old effect from OLD account
             if old_account:
-                reversed_balance = _reverse_balance_effect(old_account, old_txn_type, old_amount)
-                update_account_balance(db, old_account.db_id, reversed_balance)
+                adjust_account_balance(
+                    db, old_account.db_id,
+                    -_balance_delta(old_account.account_type, old_txn_type, old_amount),
+                )
             # Apply new effect to NEW account
             if db_transaction.account_id:
-                new_account = db.query(AccountDB).filter(AccountDB.db_id == db_transaction.account_id).first()
+                new_account = db.get(AccountDB, db_transaction.account_id)
                 if new_account:
                     update_account_balance_from_transaction(db, new_account, db_transaction)
 
+        db.commit()
+        db.refresh(db_transaction)
+
         return db_transaction
     except IntegrityError:
         db.rollback()
@@ -622,7 +681,7 @@ def _apply_transaction_updates(db: Session, db_transaction: TransactionDB,
     # Store old state for balance adjustment
     old_amount = db_transaction.amount
     old_account_id = db_transaction.account_id
-    old_account = db.query(AccountDB).filter(AccountDB.db_id == old_account_id).first() if old_account_id else None
+    old_account = db.get(AccountDB, old_account_id) if old_account_id else None
     old_txn_type = db_transaction.transaction_type
 
     # Update only the fields that are provided
@@ -786,7 +845,7 @@ def delete_db_transaction(db: Session, transaction_id: int, user_id: int) -> boo
         raise NotFoundError(f"Transaction with id {transaction_id} not found")
 
     # Get account for balance adjustment
-    account = db.query(AccountDB).filter(AccountDB.db_id == db_transaction.account_id).first()
+    account = db.get(AccountDB, db_transaction.account_id) if db_transaction.account_id else None
 
     try:
         # Store transaction info for balance adjustment and snapshot recalculation
@@ -796,12 +855,13 @@ def delete_db_transaction(db: Session, transaction_id: int, user_id: int) -> boo
         account_id = db_transaction.account_id
 
         db.delete(db_transaction)
-        db.commit()
 
         # Update account balance (reverse the transaction)
         if account:
-            new_balance = _reverse_balance_effect(account, transaction_type, transaction_amount)
-            update_account_balance(db, account.db_id, new_balance)
+            adjust_account_balance(
+                db, account.db_id, -_balance_delta(account.account_type, transaction_type, transaction_amount)
+            )
+        db.commit()
 
         # Trigger snapshot recalculation from deleted transaction's date
         if account_id:
@@ -819,22 +879,19 @@ def bulk_create_transactions(db: Session, user_id: int, transaction_import: Tran
     """Bulk import transactions with deduplication"""
 
     # Verify user exists
-    user = db.query(UserDB).filter(UserDB.db_id == user_id).first()
-    if not user:
+    if db.get(UserDB, user_id) is None:
         raise NotFoundError(f"User with id {user_id} not found")
 
     # Verify account exists and belongs to user
-    account = db.query(AccountDB).filter(
-        AccountDB.db_id == account_id,
-        AccountDB.user_id == user_id
-    ).first()
+    account = _get_owned_account(db, account_id, user_id)
     if not account:
         raise NotFoundError(f"Account with id {account_id} not found")
 
-    created_transactions = []
+    rows = []
     skipped_duplicates = []
     errors = []
 
+    prepared = []
     for i, transaction_data in enumerate(transaction_import.transactions):
         try:
             # Override source_type to match the import request
@@ -849,60 +906,65 @@ def bulk_create_transactions(db: Session, user_id: int, transaction_import: Tran
                 amount=transaction_data.amount,
                 description=transaction_data.description,
             )
+            prepared.append((i, transaction_data, transaction_hash))
+        except Exception as e:
+            errors.append({
+                'index': i,
+                'transaction': transaction_data,
+                'error': str(e)
+            })
 
-            # Check for duplicate
-            existing = db.query(TransactionDB).filter(
-                TransactionDB.user_id == user_id,
-                TransactionDB.transaction_hash == transaction_hash
-            ).first()
+    # One batched IN lookup for the hashes already stored, instead of a SELECT
+    # per row. Only stored rows count as duplicates: identical rows within one
+    # upload (two equal coffees on the same day) are both imported.
+    seen_hashes = existing_hashes(db, TransactionDB, user_id, [h for _, _, h in prepared])
 
-            if existing:
-                skipped_duplicates.append({
-                    'index': i,
-                    'transaction': transaction_data.model_dump(),
-                    'reason': 'Duplicate transaction'
-                })
-                continue
+    for i, transaction_data, transaction_hash in prepared:
+        if transaction_hash in seen_hashes:
+            skipped_duplicates.append({
+                'index': i,
+                'transaction': transaction_data,
+                'reason': 'Duplicate transaction'
+            })
+            continue
 
-            db_transaction = TransactionDB(
-                uuid=uuid4(),
-                user_id=user_id,
-                account_id=account_id,
-                category_id=None,
-                subcategory_id=None,
-                transaction_hash=transaction_hash,
-                source_type=SourceType(transaction_data.source_type.value),
-                transaction_date=transaction_data.transaction_date,
-                amount=abs(transaction_data.amount),
-                transaction_type=TransactionType(transaction_data.transaction_type.value),
-                description=transaction_data.description,
-                merchant_name=transaction_data.merchant_name,
-                comments=transaction_data.comments,
-                created_at=utcnow(),
-                updated_at=utcnow()
-            )
-            
-            db.add(db_transaction)
-            created_transactions.append(db_transaction)
-            
+        try:
+            rows.append({
+                "uuid": uuid4(),
+                "user_id": user_id,
+                "account_id": account_id,
+                "transaction_hash": transaction_hash,
+                "source_type": SourceType(transaction_data.source_type.value),
+                "transaction_date": transaction_data.transaction_date,
+                "amount": abs(transaction_data.amount),
+                "transaction_type": TransactionType(transaction_data.transaction_type.value),
+                "description": transaction_data.description,
+                "merchant_name": transaction_data.merchant_name,
+                "comments": transaction_data.comments,
+            })
         except Exception as e:
             errors.append({
                 'index': i,
-                'transaction': transaction_data.model_dump(),
+                'transaction': transaction_data,
                 'error': str(e)
             })
     
     try:
-        if created_transactions:
-            db.commit()
-            
-            # Refresh all created transactions
-            for transaction in created_transactions:
-                db.refresh(transaction)
-            
+        created_transactions = []
+        if rows:
+            # One batched INSERT ... RETURNING (paged by insertmanyvalues) hands
+            # back the loaded rows, so nothing is flushed one object at a time
+            # or refreshed afterwards. Input order is restored through the
+            # uuids generated above; sort_by_parameter_order would make SQLite
+            # fall back to one INSERT per row.
+            inserted = {
+                t.uuid: t for t in db.scalars(insert(TransactionDB).returning(TransactionDB), rows)
+            }
+            created_transactions = [inserted[row["uuid"]] for row in rows]
+
             # Update account balance based on all imported transactions
-            for t in created_transactions:
-                update_account_balance_from_transaction(db, account, t)
+            update_account_balance_from_transactions(db, account, created_transactions)
+            db.commit()
         
         # Log import results (you might want to return this info)
         import_results = {
@@ -920,68 +982,59 @@ def bulk_create_transactions(db: Session, user_id: int, transaction_import: Tran
         raise ValueError(f"Bulk transaction import failed: {str(e)}")
 
 
-def _reverse_balance_effect(account: AccountDB, transaction_type: TransactionType, amount: 'Decimal') -> 'Decimal':
-    """Calculate what the account balance would be if we reversed a transaction's effect.
+def _balance_delta(account_type: AccountType, transaction_type: TransactionType, amount: Decimal) -> Decimal:
+    """Signed change a transaction makes to its account's balance.
 
-    This is the inverse of update_account_balance_from_transaction.
     Uses abs(amount) so transaction_type alone determines direction,
     regardless of whether the stored amount is positive or negative.
+    Reversing a transaction applies the negated delta.
+
+    For credit cards, balance represents debt (positive = you owe more),
+    so the sign logic is inverted vs. checking/savings accounts.
     """
     abs_amount = abs(amount)
-    if account.account_type == AccountType.CREDIT_CARD:
-        if transaction_type in [TransactionType.PURCHASE, TransactionType.FEE]:
-            return account.balance - abs_amount
-        elif transaction_type in [TransactionType.CREDIT, TransactionType.DEPOSIT]:
-            return account.balance + abs_amount
-        elif transaction_type == TransactionType.INTEREST:
-            return account.balance - abs_amount
+    if account_type == AccountType.CREDIT_CARD:
+        # Credit card: positive balance = debt owed
+        if transaction_type in [TransactionType.PURCHASE, TransactionType.FEE, TransactionType.INTEREST]:
+            return abs_amount  # increases debt
+        elif transaction_type in [TransactionType.CREDIT, TransactionType.DEPOSIT, TransactionType.TRANSFER_IN]:
+            return -abs_amount  # reduces debt (payment received)
+        elif transaction_type == TransactionType.WITHDRAWAL:
+            return -abs_amount  # reduces debt
+        elif transaction_type == TransactionType.TRANSFER_OUT:
+            return abs_amount  # increases debt (refund sent back — rare)
         else:
-            return account.balance - abs_amount
+            raise ValueError(f"Unhandled transaction type: {transaction_type}")
     else:
-        if transaction_type in [TransactionType.CREDIT, TransactionType.DEPOSIT]:
-            return account.balance - abs_amount
-        elif transaction_type in [TransactionType.WITHDRAWAL, TransactionType.FEE, TransactionType.PURCHASE]:
-            return account.balance + abs_amount
+        # All other account types (checking, savings, loan, investment)
+        if transaction_type in [TransactionType.CREDIT, TransactionType.DEPOSIT, TransactionType.TRANSFER_IN]:
+            return abs_amount  # money received
+        elif transaction_type in [TransactionType.WITHDRAWAL, TransactionType.FEE, TransactionType.PURCHASE, TransactionType.TRANSFER_OUT]:
+            return -abs_amount  # money sent
         elif transaction_type == TransactionType.INTEREST:
-            return account.balance - abs_amount
+            return abs_amount
         else:
-            return account.balance - abs_amount
+            raise ValueError(f"Unhandled transaction type: {transaction_type}")
 
 
 def update_account_balance_from_transaction(db: Session, account: AccountDB, transaction: TransactionDB):
-    """Update account balance based on transaction type.
-
-    Uses abs(amount) so transaction_type alone determines direction,
-    regardless of whether the stored amount is positive or negative.
+    """Apply a transaction's effect to its account balance (see ``_balance_delta``).
+    Does not commit."""
+    adjust_account_balance(
+        db, account.db_id, _balance_delta(account.account_type, transaction.transaction_type, transaction.amount)
+    )
 
-    For credit cards, balance represents debt (positive = you owe more),
-    so the sign logic is inverted vs. checking/savings accounts.
-    """
-    abs_amount = abs(transaction.amount)
-    if account.account_type == AccountType.CREDIT_CARD:
-        # Credit card: positive balance = debt owed
-        if transaction.transaction_type in [TransactionType.PURCHASE, TransactionType.FEE, TransactionType.INTEREST]:
-            new_balance = account.balance + abs_amount  # increases debt
-        elif transaction.transaction_type in [TransactionType.CREDIT, TransactionType.DEPOSIT, TransactionType.TRANSFER_IN]:
-            new_balance = account.balance - abs_amount  # reduces debt (payment received)
-        elif transaction.transaction_type == TransactionType.WITHDRAWAL:
-            new_balance = account.balance - abs_amount  # reduces debt
-        elif transaction.transaction_type == TransactionType.TRANSFER_OUT:
-            new_balance = account.balance + abs_amount  # increases debt (refund sent back — rare)
-        else:
-            raise ValueError(f"Unhandled transaction type: {transaction.transaction_type}")
-    else:
-        # All other account types (checking, savings, loan, investment)
-        if transaction.transaction_type in [TransactionType.CREDIT, TransactionType.DEPOSIT, TransactionType.TRANSFER_IN]:
-            new_balance = account.balance + abs_amount  # money received
-        elif transaction.transaction_type in [TransactionType.WITHDRAWAL, TransactionType.FEE, TransactionType.PURCHASE, TransactionType.TRANSFER_OUT]:
-            new_balance = account.balance - abs_amount  # money sent
-        elif transaction.transaction_type == TransactionType.INTEREST:
-            new_balance = account.balance + abs_amount
-        else:
-            raise ValueError(f"Unhandled transaction type: {transaction.transaction_type}")
 
-    update_account_balance(db, account.db_id, new_balance)
+def update_account_balance_from_transactions(db: Session, account: AccountDB, transactions: List[TransactionDB]):
+    """Apply a batch of transactions to one account as a single summed UPDATE.
+    Does not commit."""
+    if not transactions:
+        return
+    delta = sum(
+        (_balance_delta(account.account_type, t.transaction_type, t.amount) for t in transactions),
+        Decimal('0.00'),
+    )
+    adjust_account_balance(db, account.db_id, delta)
 
 
 def get_transaction_stats(db: Session, user_id: int, filters: Optional[TransactionFilter] = None) -> TransactionStats:
@@ -993,21 +1046,8 @@ def get_transaction_stats(db: Session, user_id: int, filters: Optional[Transacti
     if filters:
         query = _apply_transaction_filters(query, filters)
 
-    transactions = query.all()
-
     liability_account_ids = _liability_account_ids(db, user_id)
 
-    def _is_liability_interest(txn) -> bool:
-        return (txn.transaction_type == TransactionType.INTEREST
-                and txn.account_id in liability_account_ids)
-
-    txn_ids = [t.db_id for t in transactions]
-    adjustments, absorbed_ids = get_refund_adjustments(db, user_id, txn_ids)
-
-    total_count = 0
-    total_income = Decimal('0.00')
-    total_expenses = Decimal('0.00')
-
     # When exactly one account is in scope, a transfer is real money crossing
     # that account's boundary, so it counts toward income/expense. Across all
     # or multiple accounts a transfer nets to zero (it's internal movement)
@@ -1019,51 +1059,87 @@ def get_transaction_stats(db: Session, user_id: int, filters: Optional[Transacti
         income_types.add(TransactionType.TRANSFER_IN)
         expense_types.add(TransactionType.TRANSFER_OUT)
 
-    for transaction in transactions:
-        if transaction.db_id in absorbed_ids:
-            continue
-        total_count += 1
-        adj = adjustments.get(transaction.db_id, Decimal('0.00'))
-        effective = max(transaction.amount - adj, Decimal('0.00'))
+    def _is_liability_interest(transaction_type, account_id) -> bool:
+        return (transaction_type == TransactionType.INTEREST
+                and account_id in liability_account_ids)
 
-        if transaction.transaction_type in income_types and not _is_liability_interest(transaction):
-            total_income += effective
-        elif transaction.transaction_type in expense_types or _is_liability_interest(transaction):
-            total_expenses += effective
+    total_count = 0
+    total_income = Decimal('0.00')
+    total_expenses = Decimal('0.00')
+
+    def _add(transaction_type, account_id, amount):
+        nonlocal total_income, total_expenses
+        liability_interest = _is_liability_interest(transaction_type, account_id)
+        if transaction_type in income_types and not liability_interest:
+            total_income += amount
+        elif transaction_type in expense_types or liability_interest:
+            total_expenses += amount
+
+    adjustments, absorbed_ids = _refund_adjustments_for(db, query.with_entities(TransactionDB.db_id))
+    adjusted_ids = set(adjustments) - absorbed_ids
+    linked_ids = adjusted_ids | absorbed_ids
+
+    # Rows no refund link touches are summed by the database. The type and
+    # account are all that decide income vs expense, so only one row per
+    # (type, account) comes back instead of every transaction.
+    plain = query.filter(TransactionDB.db_id.notin_(linked_ids)) if linked_ids else query
+    grouped = plain.with_entities(
+        TransactionDB.transaction_type,
+        TransactionDB.account_id,
+        func.count(TransactionDB.db_id),
+        func.sum(case((TransactionDB.amount > 0, TransactionDB.amount), else_=0)),
+    ).group_by(TransactionDB.transaction_type, TransactionDB.account_id)
+    for transaction_type, account_id, count, amount in grouped:
+        total_count += count
+        _add(transaction_type, account_id, amount)
+
+    # Refunded rows clamp at zero individually, so they are fetched one by one
+    if adjusted_ids:
+        for db_id, transaction_type, account_id, amount in query.filter(
+            TransactionDB.db_id.in_(adjusted_ids)
+        ).with_entities(
+            TransactionDB.db_id, TransactionDB.transaction_type, TransactionDB.account_id, TransactionDB.amount
+        ):
+            total_count += 1
+            _add(transaction_type, account_id, max(amount - adjustments[db_id], Decimal('0.00')))
 
     # If category filter is active, adjust split transaction amounts
     if filters and filters.category_ids:
-        split_txn_ids = [t.db_id for t in transactions if t.category_id is None and t.db_id not in absorbed_ids]
-        if split_txn_ids:
-            alloc_amounts = (
-                db.query(
-                    TransactionSplitAllocationDB.transaction_id,
-                    func.sum(TransactionSplitAllocationDB.amount),
-                )
-                .filter(
-                    TransactionSplitAllocationDB.transaction_id.in_(split_txn_ids),
-                    TransactionSplitAllocationDB.category_id.in_(filters.category_ids),
-                )
-                .group_by(TransactionSplitAllocationDB.transaction_id)
-                .all()
+        split_query = query.filter(TransactionDB.category_id.is_(None))
+        if absorbed_ids:
+            split_query = split_query.filter(TransactionDB.db_id.notin_(absorbed_ids))
+        alloc_amounts = (
+            db.query(
+                TransactionSplitAllocationDB.transaction_id,
+                func.sum(TransactionSplitAllocationDB.amount),
+            )
+            .filter(
+                TransactionSplitAllocationDB.transaction_id.in_(split_query.with_entities(TransactionDB.db_id)),
+                TransactionSplitAllocationDB.category_id.in_(filters.category_ids),
             )
-            alloc_map = {txn_id: amount for txn_id, amount in alloc_amounts}
-
-            for txn in transactions:
-                if txn.db_id in alloc_map and txn.db_id not in absorbed_ids:
-                    adj = adjustments.get(txn.db_id, Decimal('0.00'))
-                    full_amount = max(txn.amount - adj, Decimal('0.00'))
-                    alloc_amount = alloc_map[txn.db_id]
-                    if txn.db_id in adjustments and txn.amount:
-                        ratio = 1 - adjustments[txn.db_id] / txn.amount
-                        alloc_amount = max(alloc_amount * ratio, Decimal('0.00'))
-
-                    if txn.transaction_type in (TransactionType.PURCHASE, TransactionType.WITHDRAWAL, TransactionType.FEE) or _is_liability_interest(txn):
-                        total_expenses -= full_amount
-                        total_expenses += alloc_amount
-                    elif txn.transaction_type in (TransactionType.CREDIT, TransactionType.DEPOSIT, TransactionType.INTEREST):
-                        total_income -= full_amount
-                        total_income += alloc_amount
+            .group_by(TransactionSplitAllocationDB.transaction_id)
+            .all()
+        )
+        alloc_map = {txn_id: amount for txn_id, amount in alloc_amounts}
+
+        if alloc_map:
+            for db_id, transaction_type, account_id, amount in (
+                db.query(TransactionDB.db_id, TransactionDB.transaction_type, TransactionDB.account_id, TransactionDB.amount)
+                .filter(TransactionDB.db_id.in_(alloc_map))
+            ):
+                adj = adjustments.get(db_id, Decimal('0.00'))
+                full_amount = max(amount - adj, Decimal('0.00'))
+                alloc_amount = alloc_map[db_id]
+                if db_id in adjustments and amount:
+                    ratio = 1 - adjustments[db_id] / amount
+                    alloc_amount = max(alloc_amount * ratio, Decimal('0.00'))
+
+                if transaction_type in (TransactionType.PURCHASE, TransactionType.WITHDRAWAL, TransactionType.FEE) or _is_liability_interest(transaction_type, account_id):
+                    total_expenses -= full_amount
+                    total_expenses += alloc_amount
+                elif transaction_type in (TransactionType.CREDIT, TransactionType.DEPOSIT, TransactionType.INTEREST):
+                    total_income -= full_amount
+                    total_income += alloc_amount
 
     return TransactionStats(
         total_count=total_count,
@@ -1292,48 +1368,55 @@ def get_transactions_by_category(db: Session, user_id: int, date_from: Optional[
     if date_to:
         query = query.filter(TransactionDB.transaction_date <= date_to)
 
-    transactions = query.options(joinedload(TransactionDB.category)).all()
-
-    txn_ids = [t.db_id for t in transactions]
-    adjustments, absorbed_ids = get_refund_adjustments(db, user_id, txn_ids)
+    adjustments, absorbed_ids = _refund_adjustments_for(db, query.with_entities(TransactionDB.db_id))
+    adjusted_ids = set(adjustments) - absorbed_ids
+    linked_ids = adjusted_ids | absorbed_ids
 
     category_totals: Dict[str, Decimal] = {}
-    for transaction in transactions:
-        if transaction.db_id in absorbed_ids:
-            continue
-        category_name = transaction.category.name if transaction.category else 'Uncategorized'
-        adj = adjustments.get(transaction.db_id, Decimal('0.00'))
-        effective = max(transaction.amount - adj, Decimal('0.00'))
-        category_totals[category_name] = category_totals.get(category_name, Decimal('0.00')) + effective
-
-    # Split allocations: distribute amounts across categories
-    split_allocs = (
-        db.query(TransactionSplitAllocationDB, TransactionDB.db_id, TransactionDB.amount.label("txn_amount"))
-        .join(TransactionDB, TransactionSplitAllocationDB.transaction_id == TransactionDB.db_id)
-        .filter(TransactionDB.user_id == user_id)
-        .options(joinedload(TransactionSplitAllocationDB.category))
-    )
-    if date_from:
-        split_allocs = split_allocs.filter(TransactionDB.transaction_date >= date_from)
-    if date_to:
-        split_allocs = split_allocs.filter(TransactionDB.transaction_date <= date_to)
-    split_allocs = split_allocs.all()
 
-    if split_allocs:
-        split_txn_ids = list(set(sa[1] for sa in split_allocs))
-        split_adjustments, split_absorbed = get_refund_adjustments(db, user_id, split_txn_ids)
-
-        for alloc, txn_db_id, txn_amount in split_allocs:
-            if txn_db_id in split_absorbed:
-                continue
-            cat_name = alloc.category.name if alloc.category else 'Uncategorized'
-            adj = split_adjustments.get(txn_db_id, Decimal('0.00'))
-            if adj and txn_amount:
-                ratio = 1 - adj / txn_amount
-                effective = max(alloc.amount * ratio, Decimal('0.00'))
-            else:
-                effective = alloc.amount
-            category_totals[cat_name] = category_totals.get(cat_name, Decimal('0.00')) + effective
+    def _add(category_name, amount):
+        category_name = category_name or 'Uncategorized'
+        category_totals[category_name] = category_totals.get(category_name, Decimal('0.00')) + amount
+
+    # Rows no refund link touches are summed per category by the database;
+    # refunded rows clamp at zero individually and are fetched one by one
+    categorized = query.outerjoin(CategoryDB, TransactionDB.category_id == CategoryDB.db_id)
+    plain = categorized.filter(TransactionDB.db_id.notin_(linked_ids)) if linked_ids else categorized
+    for category_name, amount in plain.with_entities(
+        CategoryDB.name,
+        func.sum(case((TransactionDB.amount > 0, TransactionDB.amount), else_=0)),
+    ).group_by(CategoryDB.db_id, CategoryDB.name):
+        _add(category_name, amount)
+
+    if adjusted_ids:
+        for db_id, category_name, amount in categorized.filter(
+            TransactionDB.db_id.in_(adjusted_ids)
+        ).with_entities(TransactionDB.db_id, CategoryDB.name, TransactionDB.amount):
+            _add(category_name, max(amount - adjustments[db_id], Decimal('0.00')))
+
+    # Split allocations: distribute amounts across categories. Split rows
+    # belong to this query's transactions, so the refund links found above
+    # already cover them and plain splits are summed by the database too.
+    splits = (
+        query.join(TransactionSplitAllocationDB, TransactionSplitAllocationDB.transaction_id == TransactionDB.db_id)
+        .outerjoin(CategoryDB, TransactionSplitAllocationDB.category_id == CategoryDB.db_id)
+    )
+    plain_splits = splits.filter(TransactionDB.db_id.notin_(linked_ids)) if linked_ids else splits
+    for category_name, amount in plain_splits.with_entities(
+        CategoryDB.name, func.sum(TransactionSplitAllocationDB.amount),
+    ).group_by(CategoryDB.db_id, CategoryDB.name):
+        _add(category_name, amount)
+
+    if adjusted_ids:
+        for db_id, category_name, alloc_amount, txn_amount in splits.filter(
+            TransactionDB.db_id.in_(adjusted_ids)
+        ).with_entities(
+            TransactionDB.db_id, CategoryDB.name, TransactionSplitAllocationDB.amount, TransactionDB.amount
+        ):
+            if txn_amount:
+                ratio = 1 - adjustments[db_id] / txn_amount
+                alloc_amount = max(alloc_amount * ratio, Decimal('0.00'))
+            _add(category_name, alloc_amount)
 
     return category_totals
 
@@ -1452,11 +1535,7 @@ def bulk_create_transactions_from_parsed_data(
     """
     account = None
     if account_id:
-        account = (
-            db.query(AccountDB)
-            .filter(AccountDB.db_id == account_id, AccountDB.user_id == user_id)
-            .first()
-        )
+        account = _get_owned_account(db, account_id, user_id)
         if not account:
             raise NotFoundError(f"Account with id {account_id} not found for this user.")
 
@@ -1464,19 +1543,7 @@ def bulk_create_transactions_from_parsed_data(
     skipped_duplicates = []
     duplicate_count = 0
 
-    # Frozen snapshot of the user's existing hashes (pre-upload) — used to detect
-    # pre-existing duplicates. NOT mutated during the loop: within-statement
-    # duplicates are tracked separately (below) so they're auto-kept with a
-    # unique hash rather than skipped. See backend todo #73.
-    existing_hashes_dict = {
-        t.transaction_hash: t for t in
-        db.query(TransactionDB)
-        .filter(TransactionDB.user_id == user_id)
-        .all()
-    }
-    # Base hashes already emitted earlier in THIS file (within-statement dups).
-    within_statement: set[str] = set()
-
+    prepared: List[Tuple[ParsedTransaction, TransactionType, str]] = []
     for t_data in transactions:
         try:
             # Assumes parser provides the name of the enum member (case-insensitive)
@@ -1497,7 +1564,20 @@ def bulk_create_transactions_from_parsed_data(
             description=t_data.description,
             make_unique=False,
         )
+        prepared.append((t_data, transaction_type_enum, base_hash))
+
+    # Frozen snapshot of the existing rows (pre-upload) that collide with this
+    # file's hashes — used to detect pre-existing duplicates. NOT mutated during
+    # the loop: within-statement duplicates are tracked separately (below) so
+    # they're auto-kept with a unique hash rather than skipped. See backend
+    # todo #73.
+    existing_hashes_dict = existing_rows_by_hash(
+        db, TransactionDB, user_id, [base_hash for _, _, base_hash in prepared]
+    )
+    # Base hashes already emitted earlier in THIS file (within-statement dups).
+    within_statement: set[str] = set()
 
+    for t_data, transaction_type_enum, base_hash in prepared:
         # Pre-existing duplicate: this row already existed in the DB before this
         # upload. In bulk (no review) skip it — the re-upload safety net.
         is_duplicate = base_hash in existing_hashes_dict
@@ -1563,12 +1643,9 @@ def bulk_create_transactions_from_parsed_data(
         return [], skipped_duplicates
 
     try:
-        db.commit()
-        for t in created_transactions:
-            db.refresh(t)
         if account:
-            for t in created_transactions:
-                update_account_balance_from_transaction(db, account, t)
+            update_account_balance_from_transactions(db, account, created_transactions)
+        db.commit()
         return created_transactions, skipped_duplicates
     except Exception as e:
         db.rollback()
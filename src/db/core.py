@@ -1,13 +1,16 @@
 import os
 from typing import Optional
-from sqlalchemy import CheckConstraint, create_engine, event, ForeignKey, Index, UniqueConstraint, Boolean, Column, Integer, String, Text, JSON, DECIMAL, DateTime, Date
+from sqlalchemy import CheckConstraint, create_engine, event, insert, select, ForeignKey, Index, UniqueConstraint, Boolean, Column, Integer, String, Text, JSON, DECIMAL, DateTime, Date, text
 from sqlalchemy.types import Enum
+from sqlalchemy.dialects.postgresql import JSONB, insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker, DeclarativeBase, Mapped, relationship, mapped_column
 from datetime import datetime, date
 from src.utils.time import utcnow
-from uuid import UUID
+from uuid import UUID, uuid4
 from decimal import Decimal
 import enum
+import functools
 
 from dotenv import load_dotenv
 
@@ -18,6 +21,11 @@ load_dotenv()
 DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///test.db")
 
 
+# Raw parsed-row payloads: JSONB on Postgres (stored pre-parsed, GIN-indexable),
+# plain JSON/TEXT everywhere else.
+RawPayloadJSON = JSON().with_variant(JSONB(), "postgresql")
+
+
 class NotFoundError(Exception):
     pass
 
@@ -33,9 +41,7 @@ class UserDB(Base):
         # Unique constraints
         UniqueConstraint("email", name="uq_user_email"),
         UniqueConstraint("username", name="uq_user_username"),
-        
-        # Query indexes
-        Index("idx_users_email", "email"),
+        # No separate email index: uq_user_email's backing index serves lookups.
     )
 
     # Core User Identification
@@ -45,7 +51,7 @@ class UserDB(Base):
     # Authentication
     email: Mapped[str] = mapped_column(String(255), nullable=False)
     username: Mapped[str] = mapped_column(String(100), nullable=False)
-    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    password_hash: Mapped[str] = mapped_column(String(128), nullable=False)  # bcrypt: 60 chars
     
     # Personal Information
     first_name: Mapped[Optional[str]] = mapped_column(String(100))
@@ -291,10 +297,12 @@ class InvestmentTransactionDB(Base):
     __table_args__ = (
         # Query indexes
         Index("idx_investment_transactions_user_date", "user_id", "transaction_date"),
-        Index("idx_investment_transactions_account_date", "account_id", "transaction_date"),
+        Index(
+            "idx_investment_transactions_account_date",
+            "account_id", "transaction_date",
+            postgresql_include=["total_amount", "symbol"],
+        ),
         Index("idx_investment_transactions_holding", "holding_id"),
-        Index("idx_investment_transactions_date", "transaction_date"),
-        Index("idx_investment_transactions_type", "transaction_type"),
         Index("idx_investment_transactions_upload_job", "upload_job_id"),
     )
 
@@ -442,6 +450,8 @@ class DebtRepaymentScheduleDB(Base):
 
     payment_month: Mapped[date] = mapped_column(Date, nullable=False)
     scheduled_payment_amount: Mapped[Decimal] = mapped_column(DECIMAL(15, 2), nullable=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
     
     user = relationship("UserDB", back_populates="debt_repayment_schedules")
     account = relationship("AccountDB", back_populates="debt_repayment_schedules")
@@ -451,11 +461,34 @@ class TransactionDB(Base):
     __tablename__ = "transactions"
 
     __table_args__ = (
-        # Performance indexes for common queries
-        Index("idx_transactions_user_date", "user_id", "transaction_date"),
-        Index("idx_transactions_user_account", "user_id", "account_id"),
-        Index("idx_transactions_date", "transaction_date"),
+        # Performance indexes for common queries. db_id is the listing's
+        # tiebreaker, so (date, db_id) keyset pages are one index range read.
+        Index("idx_transactions_user_date_id", "user_id", "transaction_date", "db_id"),
+        # user + account + date-range scans; the leading (user_id, account_id)
+        # prefix also serves the per-account lookups the old
+        # idx_transactions_user_account covered. On Postgres the INCLUDE
+        # columns let statement/summary reads run as index-only scans.
+        Index(
+            "idx_transactions_user_account_date",
+            "user_id", "account_id", "transaction_date",
+            postgresql_include=["amount", "transaction_type", "category_id"],
+        ),
         Index("idx_transactions_upload_job", "upload_job_id"),
+        # Dedup lookups always filter by owner + hash. Not unique: a reviewed
+        # import may deliberately keep a duplicate under the same hash.
+        Index("idx_transactions_user_hash", "user_id", "transaction_hash"),
+        # description_search is a substring ILIKE; a pg_trgm GIN index lets
+        # Postgres answer it from trigram matches instead of scanning every
+        # row. Postgres-only (needs the pg_trgm extension): ddl_if keeps
+        # create_all from building it elsewhere, and the info flag tells
+        # alembic/env.py to leave it out of other dialects' comparisons.
+        Index(
+            "idx_transactions_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+            info={"postgresql_only": True},
+        ).ddl_if(dialect="postgresql"),
     )
 
     # Core Transaction Identification
@@ -656,6 +689,18 @@ class TagDB(Base):
     __table_args__ = (
         # Prevent duplicate tag names per user
         UniqueConstraint("user_id", "tag_name", name="uq_user_tag_name"),
+        # ...case-insensitively, so create/rename can insert and let the index
+        # reject a clash instead of looking it up first
+        Index("uq_user_tag_name_ci", "user_id", text("lower(tag_name)"), unique=True),
+        # search_tags is a substring ILIKE; trigram GIN index, Postgres-only
+        # like idx_transactions_description_trgm
+        Index(
+            "idx_tags_tag_name_trgm",
+            "tag_name",
+            postgresql_using="gin",
+            postgresql_ops={"tag_name": "gin_trgm_ops"},
+            info={"postgresql_only": True},
+        ).ddl_if(dialect="postgresql"),
     )
 
     # Primary Key
@@ -681,6 +726,12 @@ class TagDB(Base):
 class TransactionTagDB(Base):
     __tablename__ = "transaction_tags"
 
+    __table_args__ = (
+        # The composite PK leads with transaction_id; tag-side lookups (a tag's
+        # transactions, its stats, deleting it) need their own index
+        Index("idx_transaction_tags_tag", "tag_id"),
+    )
+
     # Composite Primary Key
     transaction_id: Mapped[int] = mapped_column(ForeignKey("transactions.db_id"), primary_key=True)
     tag_id: Mapped[int] = mapped_column(ForeignKey("tags.db_id"), primary_key=True)
@@ -762,10 +813,27 @@ class AccountValueHistoryDB(Base):
         # Ensure only one snapshot per account per day
         UniqueConstraint("account_id", "value_date", name="uq_account_value_date"),
 
-        # Query indexes for performance
-        Index("idx_account_value_account", "account_id"),
-        Index("idx_account_value_date", "value_date"),
-        Index("idx_account_value_account_date", "account_id", "value_date"),
+        # Query indexes for performance. Per-account lookups use the
+        # uq_account_value_date index, which leads with account_id. The
+        # cross-account date index is BRIN on Postgres: snapshots are written
+        # roughly in date order, so page-range summaries stay tight at a
+        # fraction of a B-tree's size. (SQLite ignores the option.)
+        Index(
+            "idx_account_value_date",
+            "value_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Review queue (data-health + per-account review list). Partial: only
+        # the few flagged rows are indexed, and maintenance is only paid when
+        # needs_review flips.
+        Index(
+            "idx_account_value_needs_review",
+            "account_id",
+            "value_date",
+            postgresql_where=text("needs_review = true"),
+            sqlite_where=text("needs_review = 1"),
+        ),
     )
 
     # Primary Key
@@ -1046,7 +1114,9 @@ class SkippedTransactionDB(Base):
     parsed_transaction_type: Mapped[str] = mapped_column(String(50), nullable=False)
     parsed_symbol: Mapped[Optional[str]] = mapped_column(String(20))  # For investment transactions
     parsed_quantity: Mapped[Optional[Decimal]] = mapped_column(DECIMAL(15, 6))  # For investment transactions
-    parsed_data_json: Mapped[Optional[str]] = mapped_column(JSON)  # Full parsed data as backup
+    # Full parsed data as backup. Deferred: the blob is only read by the
+    # skipped-transactions listing, which undefers it explicitly.
+    parsed_data_json: Mapped[Optional[str]] = mapped_column(RawPayloadJSON, deferred=True)
 
     # References to Existing Transactions (SET NULL on delete for audit preservation)
     existing_transaction_id: Mapped[Optional[UUID]] = mapped_column(
@@ -1092,7 +1162,10 @@ class ParsedImportDB(Base):
         ForeignKey("investment_transactions.uuid", ondelete="SET NULL"), nullable=True
     )
 
-    raw_parsed_data: Mapped[dict] = mapped_column(JSON, nullable=False)
+    # Deferred: written once at import and not read back by the app, but these
+    # rows are still loaded (e.g. to null their FKs when a transaction is
+    # deleted), and the raw payload is most of their width.
+    raw_parsed_data: Mapped[dict] = mapped_column(RawPayloadJSON, nullable=False, deferred=True)
     user_edits: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
     # Raw LLM output for category/merchant suggestion (#29). Null until processed
@@ -1118,7 +1191,7 @@ class ParsedImportDB(Base):
 
 
 import sqlite3
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 
 
 @event.listens_for(Engine, "connect")
@@ -1140,7 +1213,8 @@ from src.logging_config import get_logger
 _query_logger = get_logger("db.query")
 
 # Queries slower than this (ms) are logged at WARNING for slow-query detection.
-# Full SQL-statement logging stays gated behind SQL_ECHO / sqlalchemy.engine.
+# Full SQL-statement logging stays gated behind SQL_ECHO, which setup_logging
+# maps onto the sqlalchemy.engine logger level (the engine never sets echo).
 SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "500"))
 
 
@@ -1167,14 +1241,200 @@ def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
         )
 
 
-engine = create_engine(DATABASE_URL, echo=os.getenv("SQL_ECHO", "false").lower() == "true")
+# The compiled-statement cache defaults to 500 entries; the ~20 wide models ×
+# select/insert/update/delete variants overflow that and thrash the LRU.
+# insertmanyvalues_page_size sizes the batches for multi-row
+# ``session.execute(insert(Model), [...])`` calls.
+_engine_kwargs = {}
+if DATABASE_URL.startswith("postgresql"):
+    # Long-lived workers otherwise hit server-closed connections mid-request.
+    # pre_ping swaps a dead socket for a fresh one before checkout; recycle
+    # retires connections before server/proxy idle timeouts kill them. LIFO
+    # checkout keeps reusing the same warm connections under light load and
+    # lets the surplus idle out.
+    _engine_kwargs.update(
+        pool_size=int(os.getenv("DB_POOL_SIZE", "30")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "3600")),
+        pool_pre_ping=True,
+        pool_use_lifo=True,
+    )
+    if make_url(DATABASE_URL).get_driver_name() == "psycopg2":
+        # INSERTs already batch through insertmanyvalues; values_plus_batch
+        # also routes executemany UPDATE/DELETE (e.g. bulk ORM updates keyed by
+        # primary key) through psycopg2's execute_batch, one round trip per
+        # page instead of per row.
+        _engine_kwargs.update(
+            executemany_mode="values_plus_batch",
+            executemany_batch_page_size=500,
+        )
+
+engine = create_engine(
+    DATABASE_URL,
+    query_cache_size=1200,
+    insertmanyvalues_page_size=1000,
+    **_engine_kwargs,
+)
+
+
+# SQLITE_TUNING=false leaves the app engine on stock SQLite settings (e.g. for
+# CI runs against a file database). Read once, when the listener is registered.
+SQLITE_TUNING = os.getenv("SQLITE_TUNING", "true").lower() in ("1", "true")
+
+
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune the file-backed SQLite dev database for bulk imports. WAL avoids
+    the rollback-journal double write and synchronous=NORMAL drops the
+    per-commit fsync to one per checkpoint; a 64 MB page cache keeps the
+    index pages of the ingest tables resident. Bound to the app engine only, so
+    the in-memory test engines keep SQLite defaults; no-op on Postgres."""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.execute("PRAGMA synchronous = NORMAL")
+        cursor.execute("PRAGMA temp_store = MEMORY")
+        cursor.execute("PRAGMA mmap_size = 268435456")
+        cursor.execute("PRAGMA cache_size = -64000")
+        cursor.close()
+
+
+if SQLITE_TUNING:
+    event.listen(engine, "connect", _sqlite_pragmas)
+
+
 session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@functools.lru_cache(maxsize=None)
+def _insert_statement(model):
+    # One Insert per mapped class, built once: every batch for a model has the
+    # same shape, so the compiled-cache key stays stable across calls.
+    return insert(model)
+
+
+def bulk_insert(db, model, rows: list[dict]) -> int:
+    """Insert plain column dicts for ``model`` in one executemany call.
+
+    Use this instead of per-object ``db.add()`` loops for high-volume writes:
+    SQLAlchemy 2.0 batches the rows into multi-row ``INSERT ... VALUES``
+    statements (``insertmanyvalues``, paged by ``insertmanyvalues_page_size``)
+    rather than flushing one ORM instance at a time. Rows missing a ``uuid``
+    get one when the model has that column; other Python-side column defaults
+    still apply. Does not commit and returns the row count, not ORM objects."""
+    if not rows:
+        return 0
+    if "uuid" in model.__table__.c:
+        for row in rows:
+            row.setdefault("uuid", uuid4())
+    db.execute(_insert_statement(model), rows)
+    return len(rows)
+
+
+_DIALECT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+def _dialect_insert(model, dialect_name: str):
+    try:
+        return _DIALECT_INSERTS[dialect_name](model)
+    except KeyError:
+        raise ValueError(f"ON CONFLICT inserts are not supported on dialect {dialect_name!r}") from None
+
+
+@functools.lru_cache(maxsize=None)
+def _insert_ignoring_conflicts_statement(model, dialect_name: str, conflict_columns: tuple):
+    return (
+        _dialect_insert(model, dialect_name)
+        .on_conflict_do_nothing(index_elements=list(conflict_columns))
+        .returning(*model.__table__.primary_key.columns)
+    )
+
+
+def bulk_insert_ignoring_conflicts(db, model, rows: list[dict], conflict_columns) -> list[tuple]:
+    """Like ``bulk_insert``, but rows that would violate the unique constraint
+    on ``conflict_columns`` are skipped (``INSERT ... ON CONFLICT DO NOTHING``)
+    instead of raising or being looked up first.
+
+    ``conflict_columns`` must match a real unique constraint or index; note
+    transaction_hash is NOT unique, so this does not apply to import dedup.
+    Only Postgres and SQLite are supported. Does not commit; returns the
+    primary key tuples of the rows actually inserted."""
+    if not rows:
+        return []
+    if "uuid" in model.__table__.c:
+        for row in rows:
+            row.setdefault("uuid", uuid4())
+    stmt = _insert_ignoring_conflicts_statement(
+        model, db.get_bind().dialect.name, tuple(conflict_columns)
+    )
+    return [tuple(row) for row in db.execute(stmt, rows)]
+
+
+@functools.lru_cache(maxsize=None)
+def _upsert_statement(model, dialect_name: str, conflict_columns: tuple, update_columns: tuple):
+    stmt = _dialect_insert(model, dialect_name)
+    return stmt.on_conflict_do_update(
+        index_elements=list(conflict_columns),
+        set_={column: stmt.excluded[column] for column in update_columns},
+    )
+
+
+def bulk_upsert(db, model, rows: list[dict], conflict_columns, update_columns) -> int:
+    """Insert ``rows``, or for rows whose ``conflict_columns`` key already
+    exists, overwrite just ``update_columns`` in place (``INSERT ... ON
+    CONFLICT DO UPDATE``). Existing rows keep their db_id/uuid.
+    Same constraints as ``bulk_insert_ignoring_conflicts``; does not commit
+    and returns the row count."""
+    if not rows:
+        return 0
+    if "uuid" in model.__table__.c:
+        for row in rows:
+            row.setdefault("uuid", uuid4())
+    stmt = _upsert_statement(
+        model, db.get_bind().dialect.name, tuple(conflict_columns), tuple(update_columns)
+    )
+    db.execute(stmt, rows)
+    return len(rows)
+
+
+# Keeps each IN (...) list well under SQLite's bound-parameter limit.
+HASH_LOOKUP_BATCH_SIZE = 500
+
+
+def existing_rows_by_hash(db, model, user_id: int, hashes) -> dict:
+    """Map ``transaction_hash -> row`` for the user's existing ``model`` rows
+    whose hash is in ``hashes``.
+
+    Import dedup needs only the rows that collide with the incoming batch, so
+    this issues one ``WHERE transaction_hash IN (...)`` per
+    HASH_LOOKUP_BATCH_SIZE hashes (served by the user/hash indexes) instead of
+    a query per row or a scan of the user's whole history."""
+    unique_hashes = list(dict.fromkeys(hashes))
+    found = {}
+    for start in range(0, len(unique_hashes), HASH_LOOKUP_BATCH_SIZE):
+        batch = unique_hashes[start:start + HASH_LOOKUP_BATCH_SIZE]
+        rows = db.query(model).filter(
+            model.user_id == user_id,
+            model.transaction_hash.in_(batch),
+        ).all()
+        found.update((row.transaction_hash, row) for row in rows)
+    return found
+
+
+def existing_hashes(db, model, user_id: int, hashes) -> set:
+    """Like ``existing_rows_by_hash`` but selects only the hash column, for
+    callers that just skip duplicates and never look at the stored row."""
+    unique_hashes = list(dict.fromkeys(hashes))
+    found = set()
+    for start in range(0, len(unique_hashes), HASH_LOOKUP_BATCH_SIZE):
+        batch = unique_hashes[start:start + HASH_LOOKUP_BATCH_SIZE]
+        found.update(db.scalars(select(model.transaction_hash).where(
+            model.user_id == user_id,
+            model.transaction_hash.in_(batch),
+        )))
+    return found
+
+
 # Dependency to get the database session
 def get_db():
-    database = session_local()
-    try:
+    with session_local() as database:
         yield database
-    finally:
-        database.close()
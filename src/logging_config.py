@@ -136,6 +136,20 @@ def setup_logging(
         logger = logging.getLogger(logger_name)
         logger.setLevel(third_party_level)
 
+    # SQL statement logging. The engine is created without echo=True (which
+    # would attach SQLAlchemy's own stdout handler for the process lifetime);
+    # instead SQL_ECHO raises sqlalchemy.engine to INFO and routes it through
+    # the JSON console handler. Connections check the logger level when they
+    # are checked out, so the level can also be flipped at runtime without a
+    # restart, and when it's off statements and parameters are never formatted.
+    if os.getenv("SQL_ECHO", "false").lower() in ("1", "true"):
+        sql_logger = logging.getLogger("sqlalchemy.engine")
+        sql_logger.setLevel(logging.INFO)
+        logging.getLogger("sqlalchemy.engine.Engine").setLevel(logging.INFO)
+        sql_logger.handlers.clear()
+        sql_logger.addHandler(console_handler)
+        sql_logger.propagate = False
+
     # Prevent duplicate logs by not propagating to root logger
     app_logger.propagate = False
 
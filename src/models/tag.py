@@ -20,8 +20,7 @@ class TagCreate(BaseModel):
     @field_validator('color')
     @classmethod
     def validate_color(cls, v: Optional[str]) -> Optional[str]:
-        if v and not v.startswith('#'):
-            v = f"#{v}"
+        # The Field pattern has already required the leading '#'
         return v.upper() if v else v
 
 
@@ -38,8 +37,7 @@ class TagUpdate(BaseModel):
     @field_validator('color')
     @classmethod
     def validate_color(cls, v: Optional[str]) -> Optional[str]:
-        if v and not v.startswith('#'):
-            v = f"#{v}"
+        # The Field pattern has already required the leading '#'
         return v.upper() if v else v
 
 
@@ -32,13 +32,17 @@ def create_tag(
 def read_tags(
     skip: int = 0,
     limit: int = 100,
+    include_transaction_count: bool = False,
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id)
 ):
     """
     Retrieve all tags for the current user.
     """
-    return crud_tag.read_db_tags(db=db, user_id=user_id, skip=skip, limit=limit)
+    return crud_tag.read_db_tags(
+        db=db, user_id=user_id, skip=skip, limit=limit,
+        include_transaction_count=include_transaction_count
+    )
 
 @router.get("/search/", response_model=List[tag_models.TagResponse])
 def search_tags(
@@ -200,22 +204,22 @@ def bulk_tag_transactions(
     if not db_tag:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
 
-    # Resolve transaction UUIDs to int IDs
-    from src.crud.crud_transaction import read_db_transaction_by_uuid
+    # Resolve transaction UUIDs to int IDs in one query
+    from src.crud.crud_transaction import read_db_transaction_ids_by_uuids
+    ids_by_uuid = read_db_transaction_ids_by_uuids(db, bulk_tag_request.transaction_uuids, user_id)
     transaction_ids = []
     for t_uuid in bulk_tag_request.transaction_uuids:
-        txn = read_db_transaction_by_uuid(db, t_uuid, user_id)
-        if not txn:
+        if t_uuid not in ids_by_uuid:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Transaction {t_uuid} not found")
-        transaction_ids.append(txn.db_id)
+        transaction_ids.append(ids_by_uuid[t_uuid])
 
     try:
-        created_relations = crud_tag.bulk_tag_transactions(
+        tagged_count = crud_tag.bulk_tag_transactions(
             db=db, user_id=user_id, transaction_ids=transaction_ids, tag_id=db_tag.db_id
         )
         return {
-            "message": f"{len(created_relations)} transaction(s) tagged successfully.",
-            "tagged_count": len(created_relations)
+            "message": f"{tagged_count} transaction(s) tagged successfully.",
+            "tagged_count": tagged_count
         }
     except (NotFoundError, ValueError) as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -19,6 +19,7 @@ from src.crud.crud_transaction import (
     create_db_transaction,
     read_db_transaction_by_uuid,
     read_db_transactions,
+    read_transaction_page_cursor,
     get_transaction_stats,
     get_monthly_averages,
     update_db_transaction_by_uuid,
@@ -147,19 +148,32 @@ def list_transactions(
     description_search: Optional[str] = Query(None),
     order_by: str = Query("transaction_date"),
     order_desc: bool = Query(True),
+    after_uuid: Optional[UUID] = Query(None),
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
 ) -> List[TransactionResponse]:
-    """List and filter transactions with pagination."""
+    """List and filter transactions with pagination.
+
+    Pass the id of the last transaction on the current page as ``after_uuid``
+    to fetch the next page by keyset instead of ``skip``; deep pages then cost
+    the same as the first."""
     filters = _build_filters(
         db, user_id, account_uuid, category_uuid, subcategory_uuid, tag_uuid,
         transaction_type, merchant_name, date_from, date_to, amount_min, amount_max,
         description_search,
     )
-    transactions = read_db_transactions(
-        db, user_id, filters=filters, skip=skip, limit=limit,
-        order_by=order_by, order_desc=order_desc,
-    )
+    after = None
+    if after_uuid is not None:
+        after = read_transaction_page_cursor(db, user_id, after_uuid)
+        if after is None:
+            raise HTTPException(status_code=404, detail="Transaction not found")
+    try:
+        transactions = read_db_transactions(
+            db, user_id, filters=filters, skip=skip, limit=limit,
+            order_by=order_by, order_desc=order_desc, after=after,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return [TransactionResponse.model_validate(t) for t in transactions]
 
 
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, Response
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 import io
 import time
 from uuid import uuid4, UUID
@@ -13,7 +13,7 @@ from src.db.core import (
     get_db, NotFoundError, UploadJobDB, BulkImportBatchDB, SkippedTransactionDB, TransactionDB,
     InvestmentTransactionDB,
     AccountDB, TransactionType, SourceType, InvestmentTransactionType, AccountType,
-    CategoryDB, TagDB, TransactionTagDB, ParsedImportDB,
+    CategoryDB, TagDB, TransactionTagDB, ParsedImportDB, bulk_insert,
 )
 from src.auth.dependencies import get_current_user_id
 from src.services.importer import PARSER_MAPPING
@@ -39,7 +39,7 @@ from src.constants.categories import all_category_uuids
 from src.services.system_tags import get_system_tag, append_review_note
 from src.crud.crud_transaction import (
     generate_transaction_hash,
-    update_account_balance_from_transaction,
+    update_account_balance_from_transactions,
     delete_db_transaction_by_uuid,
 )
 from src.crud.crud_investment import (
@@ -523,7 +523,9 @@ def get_skipped_transactions(
         raise HTTPException(status_code=404, detail="Upload job not found")
 
     # Get skipped transactions
-    skipped = db.query(SkippedTransactionDB).filter(
+    skipped = db.query(SkippedTransactionDB).options(
+        undefer(SkippedTransactionDB.parsed_data_json)
+    ).filter(
         SkippedTransactionDB.upload_job_id == job.db_id
     ).offset(skip).limit(limit).all()
 
@@ -1585,24 +1587,24 @@ async def confirm_statement_import(
     upload_job.investment_transactions_created = len(created_inv)
     upload_job.needs_review = needs_review_count
 
-    # Flush to assign db_ids, then create tag associations
+    # Flush to assign db_ids, then create tag associations in one executemany
     if pending_tag_associations:
         db.flush()
-        for db_txn, tag_ids in pending_tag_associations:
-            for tag_id in tag_ids:
-                db.add(TransactionTagDB(transaction_id=db_txn.db_id, tag_id=tag_id))
+        bulk_insert(db, TransactionTagDB, [
+            {"transaction_id": db_txn.db_id, "tag_id": tag_id}
+            for db_txn, tag_ids in pending_tag_associations
+            for tag_id in tag_ids
+        ])
 
     # Commit all transactions
     try:
-        db.commit()
-
-        # Post-commit: update account balances for regular transactions
-        # Skip for investment accounts — _update_investment_account_balance
-        # handles the full balance via transaction replay.
+        # Update the account balance for regular transactions in the same
+        # commit, as one summed UPDATE. Skip for investment accounts —
+        # _update_investment_account_balance handles the full balance via
+        # transaction replay.
         if account and account.account_type != AccountType.INVESTMENT:
-            for t in created_txns:
-                db.refresh(t)
-                update_account_balance_from_transaction(db, account, t)
+            update_account_balance_from_transactions(db, account, created_txns)
+        db.commit()
 
         # Post-commit: rebuild holdings from investment transactions
         if created_inv:
@@ -517,7 +517,7 @@ def _reverse_balance_for_type(
     Pure function to reverse a transaction's balance effect.
 
     Given the current balance, returns what the balance was BEFORE this transaction.
-    Mirrors the logic in crud_transaction._reverse_balance_effect but takes explicit args.
+    Same as applying the negated crud_transaction._balance_delta, but takes explicit args.
     """
     abs_amount = abs(amount)
     if account_type == AccountType.CREDIT_CARD:
@@ -23,7 +23,7 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from src.db.core import CategoryDB, TransactionTagDB, TransactionType
+from src.db.core import CategoryDB, TransactionTagDB, TransactionType, bulk_insert
 from src.services.importer import PARSER_MAPPING
 from src.services.description_cleanup import process_preview_items, CleanedResult
 from src.services.system_tags import ensure_system_tags, get_system_tag, append_review_note
@@ -171,14 +171,13 @@ def _apply_cleanup_to_created(db, user_id, created_rows, parsed_txns, results: l
 
     needs_review_count = 0
     if needs_review_tag and needs_review_rows:
-        # Need db_id for the join row; flush so SQLAlchemy assigns it.
+        # Need db_id for the join row; flush so SQLAlchemy assigns it. The
+        # links themselves go in as one executemany, not an ORM add per row.
         db.flush()
-        for row in needs_review_rows:
-            db.add(TransactionTagDB(
-                transaction_id=row.db_id,
-                tag_id=needs_review_tag.db_id,
-            ))
-        needs_review_count = len(needs_review_rows)
+        needs_review_count = bulk_insert(db, TransactionTagDB, [
+            {"transaction_id": row.db_id, "tag_id": needs_review_tag.db_id}
+            for row in needs_review_rows
+        ])
 
     return suggestions_applied, fallthroughs, needs_review_count
 
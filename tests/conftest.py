@@ -108,6 +108,22 @@ def db(engine):
         connection.close()
 
 
+@pytest.fixture
+def query_counter(db):
+    """Collects every SQL statement the test session executes, for N+1
+    regression checks. Call ``.clear()`` after setup to count only the code
+    under test."""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", _record)
+    yield statements
+    event.remove(bind, "before_cursor_execute", _record)
+
+
 @pytest.fixture
 def fake_redis():
     client = FakeRedis(decode_responses=True)
@@ -29,8 +29,8 @@ class TestForwardBalanceCreditCard(unittest.TestCase):
         txn = FakeTransaction(txn_type, amount)
         db = MagicMock()
         captured = {}
-        with patch("src.crud.crud_transaction.update_account_balance",
-                    side_effect=lambda db, aid, nb: captured.update(balance=nb)):
+        with patch("src.crud.crud_transaction.adjust_account_balance",
+                    side_effect=lambda db, aid, delta: captured.update(balance=account.balance + delta)):
             update_account_balance_from_transaction(db, account, txn)
         return captured['balance']
 
@@ -52,8 +52,8 @@ class TestForwardBalanceChecking(unittest.TestCase):
         txn = FakeTransaction(txn_type, amount)
         db = MagicMock()
         captured = {}
-        with patch("src.crud.crud_transaction.update_account_balance",
-                    side_effect=lambda db, aid, nb: captured.update(balance=nb)):
+        with patch("src.crud.crud_transaction.adjust_account_balance",
+                    side_effect=lambda db, aid, delta: captured.update(balance=account.balance + delta)):
             update_account_balance_from_transaction(db, account, txn)
         return captured['balance']
 
@@ -110,8 +110,8 @@ class TestForwardReverseSymmetry(unittest.TestCase):
         txn = FakeTransaction(txn_type, amount)
         db = MagicMock()
         captured = {}
-        with patch("src.crud.crud_transaction.update_account_balance",
-                    side_effect=lambda db, aid, nb: captured.update(balance=nb)):
+        with patch("src.crud.crud_transaction.adjust_account_balance",
+                    side_effect=lambda db, aid, delta: captured.update(balance=account.balance + delta)):
             update_account_balance_from_transaction(db, account, txn)
 
         new_balance = captured['balance']
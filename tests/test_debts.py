@@ -5,12 +5,14 @@ flagged as missing now exist), plan↔account links, monthly schedules, and debt
 payments. Schedules require a LOAN account; payments require LOAN or
 CREDIT_CARD. Plan and payment responses both expose their UUID under "id".
 """
+from datetime import date, datetime
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import select
 
-from src.db.core import AccountType
+from src.db.core import AccountType, DebtRepaymentScheduleDB
 from tests.factories import make_account
 
 pytestmark = pytest.mark.integration
@@ -138,6 +140,53 @@ def test_create_and_read_schedule(client, db, test_user):
     assert all(Decimal(str(r["scheduled_payment_amount"])) == Decimal("300.00") for r in rows)
 
 
+def test_replacing_schedule_upserts_kept_months_and_drops_the_rest(client, db, test_user):
+    loan = _loan(db, test_user)
+
+    def _post(*entries):
+        body = {
+            "account_uuid": str(loan.uuid),
+            "schedules": [{"payment_month": m, "scheduled_payment_amount": a} for m, a in entries],
+        }
+        assert client.post("/debt/schedules/", json=body).status_code == 201
+        return {r["payment_month"]: r for r in client.get(f"/debt/schedules/{loan.uuid}").json()}
+
+    before = _post(("2026-01-01", "300.00"), ("2026-02-01", "300.00"))
+    after = _post(("2026-02-01", "350.00"), ("2026-03-01", "350.00"))
+
+    assert set(after) == {"2026-02-01", "2026-03-01"}
+    assert after["2026-02-01"]["id"] == before["2026-02-01"]["id"]
+    assert Decimal(str(after["2026-02-01"]["scheduled_payment_amount"])) == Decimal("350.00")
+
+
+def test_replacing_schedule_stamps_updated_at_on_upserted_months(client, db, test_user, monkeypatch):
+    import src.crud.crud_debt as crud_debt
+
+    loan = _loan(db, test_user)
+
+    def _post(*months):
+        body = {
+            "account_uuid": str(loan.uuid),
+            "schedules": [{"payment_month": m, "scheduled_payment_amount": "300.00"} for m in months],
+        }
+        assert client.post("/debt/schedules/", json=body).status_code == 201
+
+    _post("2026-01-01")
+    stamp = datetime(2030, 1, 1, 12, 0)
+    monkeypatch.setattr(crud_debt, "utcnow", lambda: stamp)
+    _post("2026-01-01", "2026-02-01")
+
+    rows = db.execute(
+        select(DebtRepaymentScheduleDB.payment_month, DebtRepaymentScheduleDB.created_at,
+               DebtRepaymentScheduleDB.updated_at)
+        .where(DebtRepaymentScheduleDB.account_id == loan.db_id)
+    ).all()
+    by_month = {month: (created, updated) for month, created, updated in rows}
+    assert by_month[date(2026, 1, 1)][1] == stamp
+    assert by_month[date(2026, 1, 1)][0] < stamp
+    assert by_month[date(2026, 2, 1)][1] == stamp
+
+
 def test_create_schedule_unknown_account_404(client):
     body = {"account_uuid": str(uuid4()), "schedules": []}
     assert client.post("/debt/schedules/", json=body).status_code == 404
@@ -78,6 +78,22 @@ def test_full_sell_removes_holding(db, user, account):
     assert _holdings_by_symbol(db, account) == {}
 
 
+def test_closed_holding_unlinks_its_transactions_and_latest_security_type_wins(db, user, account):
+    buy = _buy(db, user, account, symbol="QQQ", quantity=Decimal("10"), price_per_share=Decimal("100"), transaction_date=date(2026, 1, 1))
+    sell = make_investment_txn(
+        db, user, account, transaction_type=InvestmentTransactionType.SELL,
+        symbol="QQQ", quantity=Decimal("10"), price_per_share=Decimal("120"),
+        transaction_date=date(2026, 1, 2),
+    )
+    _buy(db, user, account, symbol="VTI", security_type="STOCK", quantity=Decimal("1"), price_per_share=Decimal("200"), transaction_date=date(2026, 1, 1))
+    _buy(db, user, account, symbol="VTI", security_type="ETF", quantity=Decimal("1"), price_per_share=Decimal("210"), transaction_date=date(2026, 1, 3))
+
+    holdings = _holdings_by_symbol(db, account)
+    assert set(holdings) == {"VTI"}
+    assert holdings["VTI"].security_type == "ETF"
+    assert buy.holding_id is None and sell.holding_id is None
+
+
 def test_option_and_stock_do_not_merge(db, user, account):
     _buy(db, user, account, symbol="QQQ", quantity=Decimal("10"), price_per_share=Decimal("400"), transaction_date=date(2026, 1, 1))
     _buy(
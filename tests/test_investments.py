@@ -10,7 +10,9 @@ from decimal import Decimal
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
 
+from src.crud import crud_investment
 from src.db.core import AccountType
 from tests.factories import make_account, make_user
 
@@ -93,6 +95,19 @@ def test_list_transactions_for_account(client, db, test_user):
     assert {t["symbol"] for t in txns} == {"AAPL", "MSFT"}
 
 
+def test_list_transactions_loads_account_from_the_ownership_join(client, db, test_user, query_counter):
+    acct = _inv_account(db, test_user)
+    client.post("/investments/transactions/", json=_buy(acct.uuid))
+    client.post("/investments/transactions/", json=_buy(acct.uuid, symbol="MSFT", transaction_date="2026-02-01"))
+    query_counter.clear()
+
+    txns = client.get(f"/investments/accounts/{acct.uuid}/transactions/").json()
+    assert {t["account_uuid"] for t in txns} == {str(acct.uuid)}
+    listing = [s for s in query_counter if "FROM investment_transactions" in s]
+    assert len(listing) == 1
+    assert listing[0].count("JOIN accounts") == 1
+
+
 def test_list_transactions_unknown_account_404(client):
     assert client.get(f"/investments/accounts/{uuid4()}/transactions/").status_code == 404
 
@@ -105,6 +120,38 @@ def test_bulk_upload_transactions(client, db, test_user):
     assert len(resp.json()) == 2
 
 
+def test_bulk_upload_reloads_created_rows_in_one_query(client, db, test_user, query_counter):
+    acct = _inv_account(db, test_user)
+    rows = [_buy(acct.uuid, transaction_date=f"2026-01-1{i}") for i in range(4)]
+    query_counter.clear()
+
+    assert client.post("/investments/transactions/bulk-upload", json={"transactions": rows}).status_code == 201
+    # The rebuild commit expires the new rows; they come back in one batched
+    # reload, never one SELECT per row, however many rows are uploaded.
+    selects = [s for s in query_counter if s.startswith("SELECT")]
+    per_row = [s for s in selects if "WHERE investment_transactions.db_id =" in s]
+    batched = [s for s in selects if "investment_transactions.db_id IN" in s]
+    assert per_row == []
+    assert len(batched) == 1
+
+
+def test_create_is_atomic_with_the_holdings_rebuild(db, test_user, monkeypatch):
+    from src.db.core import InvestmentTransactionDB
+    from src.models.investment import InvestmentTransactionCreate
+
+    acct = _inv_account(db, test_user)
+
+    def _fail(*args, **kwargs):
+        raise IntegrityError("rebuild", {}, Exception("forced"))
+
+    monkeypatch.setattr(crud_investment, "rebuild_holdings_from_transactions", _fail)
+    with pytest.raises(ValueError):
+        crud_investment.create_db_investment_transaction(
+            db, test_user.db_id, InvestmentTransactionCreate(**_buy(acct.uuid)), account_id=acct.db_id
+        )
+    assert db.query(InvestmentTransactionDB).filter_by(account_id=acct.db_id).count() == 0
+
+
 def test_unauthenticated_401(unauth_client, db, test_user):
     acct = _inv_account(db, test_user)
     assert unauth_client.get(f"/investments/accounts/{acct.uuid}/transactions/").status_code == 401
@@ -121,6 +168,61 @@ def test_buy_creates_holding(client, db, test_user):
     assert holdings[0]["account_uuid"] == str(acct.uuid)
 
 
+def test_holdings_listing_raises_on_unloaded_relationships(client, db, test_user):
+    acct = _inv_account(db, test_user)
+    client.post("/investments/transactions/", json=_buy(acct.uuid))
+    db.expire_all()
+
+    holdings = crud_investment.read_db_investment_holdings_by_account(db, acct.db_id, test_user.db_id)
+    assert holdings[0].account.uuid == acct.uuid
+    with pytest.raises(InvalidRequestError):
+        holdings[0].investment_transactions
+
+
+def test_holdings_by_account_checks_ownership_in_the_listing_query(client, db, test_user, query_counter):
+    from src.db.core import NotFoundError
+
+    acct = _inv_account(db, test_user)
+    client.post("/investments/transactions/", json=_buy(acct.uuid))
+    account_id, user_id = acct.db_id, test_user.db_id
+    query_counter.clear()
+
+    assert len(crud_investment.read_db_investment_holdings_by_account(db, account_id, user_id)) == 1
+    assert len(query_counter) == 1
+
+    empty = make_account(db, test_user, account_name="Empty", account_type=AccountType.INVESTMENT)
+    assert crud_investment.read_db_investment_holdings_by_account(db, empty.db_id, test_user.db_id) == []
+    other = make_user(db, email="other-inv@example.com", username="otherinv")
+    with pytest.raises(NotFoundError):
+        crud_investment.read_db_investment_holdings_by_account(db, acct.db_id, other.db_id)
+
+
+def test_list_transactions_pages_off_the_user_date_index(db, test_user, query_counter):
+    crud_investment.read_db_investment_transactions(db, test_user.db_id)
+    plan = " | ".join(
+        row[3] for row in db.connection().exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + query_counter[-1], (test_user.db_id, 100, 0)
+        )
+    )
+    assert "idx_investment_transactions_user_date" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_read_transaction_by_id_scopes_on_its_own_user_id(client, db, test_user, query_counter):
+    acct = _inv_account(db, test_user)
+    client.post("/investments/transactions/", json=_buy(acct.uuid))
+    txn = crud_investment.read_db_investment_transactions(db, test_user.db_id)[0]
+    txn_id, user_id = txn.db_id, test_user.db_id
+    query_counter.clear()
+
+    assert crud_investment.read_db_investment_transaction(db, txn_id, user_id) is txn
+    assert len(query_counter) == 1
+    assert "accounts" not in query_counter[0]
+
+    other = make_user(db, email="other-txn@example.com", username="othertxn")
+    assert crud_investment.read_db_investment_transaction(db, txn_id, other.db_id) is None
+
+
 def test_read_holding_200_and_404(client, db, test_user):
     acct = _inv_account(db, test_user)
     client.post("/investments/transactions/", json=_buy(acct.uuid))
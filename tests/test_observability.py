@@ -6,6 +6,9 @@ hangs off the root logger) can't see its records. `pw_logs` attaches a handler
 directly to `pocket_watcher` and collects the LogRecords instead.
 """
 import logging
+import os
+import subprocess
+import sys
 
 import pytest
 from fastapi.testclient import TestClient
@@ -70,6 +73,48 @@ def test_fast_query_not_logged(db, pw_logs, monkeypatch):
     assert not _by_message(pw_logs, "db.slow_query")
 
 
+def test_app_engine_statement_cache_is_active():
+    # A dialect without supports_statement_cache silently disables the
+    # compiled-statement LRU; pin both the flag and the sized cache.
+    assert db_core.engine.dialect.supports_statement_cache is True
+    assert db_core.engine._compiled_cache.capacity == 1200
+
+
+@pytest.mark.parametrize("flag, journal_mode", [(None, "wal"), ("false", "delete")])
+def test_sqlite_tuning_flag_gates_app_engine_pragmas(tmp_path, flag, journal_mode):
+    # The flag is read when core is imported, so check it in a fresh process.
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{tmp_path / 'app.db'}"}
+    env.pop("SQLITE_TUNING", None)
+    if flag is not None:
+        env["SQLITE_TUNING"] = flag
+    script = (
+        "from sqlalchemy import text; from src.db.core import engine\n"
+        "with engine.connect() as c: print(c.execute(text('PRAGMA journal_mode')).scalar())"
+    )
+    out = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == journal_mode
+
+
+def test_sql_echo_routes_through_logger_not_engine_echo(monkeypatch):
+    from src.logging_config import setup_logging
+
+    assert not db_core.engine.echo
+    sql_logger = logging.getLogger("sqlalchemy.engine")
+    engine_logger = logging.getLogger("sqlalchemy.engine.Engine")
+    saved = (sql_logger.level, engine_logger.level, sql_logger.propagate, list(sql_logger.handlers))
+    monkeypatch.setenv("SQL_ECHO", "true")
+    try:
+        setup_logging()
+        assert engine_logger.getEffectiveLevel() == logging.INFO
+        assert db_core.engine._should_log_info()
+    finally:
+        sql_logger.setLevel(saved[0])
+        engine_logger.setLevel(saved[1])
+        sql_logger.propagate = saved[2]
+        sql_logger.handlers[:] = saved[3]
+    assert not db_core.engine._should_log_info()
+
+
 def test_validation_error_is_logged(client, pw_logs):
     resp = client.get("/accounts/not-a-valid-uuid")
     assert resp.status_code == 422
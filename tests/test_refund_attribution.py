@@ -14,11 +14,17 @@ import pytest
 from src.crud.crud_transaction import (
     get_refund_adjustments,
     get_transaction_stats,
+    get_transactions_by_category,
     validate_refund_allocation,
 )
-from src.db.core import RelationshipType, TransactionRelationshipDB, TransactionType
+from src.db.core import (
+    RelationshipType,
+    TransactionRelationshipDB,
+    TransactionSplitAllocationDB,
+    TransactionType,
+)
 from src.models.transaction import TransactionFilter
-from tests.factories import make_account, make_transaction, make_user
+from tests.factories import make_account, make_category, make_transaction, make_user
 
 pytestmark = pytest.mark.integration
 
@@ -156,3 +162,56 @@ def test_stats_over_allocation_clamps_to_zero(db, user, account):
 
     stats = get_transaction_stats(db, user.db_id)
     assert stats.total_expenses == Decimal("0.00")  # max(100 - 120, 0)
+
+
+# ===== grouped aggregation =====
+
+def test_stats_sum_plain_rows_in_sql_and_clamp_refunded_rows(db, user, account, query_counter):
+    for amount in ("10.00", "20.00", "30.00"):
+        make_transaction(db, user, account, amount=Decimal(amount), transaction_type=TransactionType.PURCHASE)
+    original = make_transaction(db, user, account, amount=Decimal("100.00"), transaction_type=TransactionType.PURCHASE)
+    refund = make_transaction(db, user, account, amount=Decimal("30.00"), transaction_type=TransactionType.CREDIT)
+    _rel(db, refund, original, RelationshipType.REFUNDS, "30.00")
+    user_id = user.db_id
+    query_counter.clear()
+
+    stats = get_transaction_stats(db, user_id)
+    assert (stats.total_count, stats.total_expenses, stats.total_income) == (4, Decimal("130.00"), Decimal("0.00"))
+    # liability accounts, refund links, one grouped sum, the refunded row
+    assert len(query_counter) == 4
+    assert any("GROUP BY" in q and "sum(" in q for q in query_counter)
+
+
+def test_transactions_by_category_nets_refunds_per_category(db, user, account):
+    groceries = make_category(db, name="Groceries")
+    make_transaction(db, user, account, amount=Decimal("15.00"), category_id=groceries.db_id)
+    original = make_transaction(db, user, account, amount=Decimal("100.00"), category_id=groceries.db_id)
+    refund = make_transaction(db, user, account, amount=Decimal("40.00"), transaction_type=TransactionType.CREDIT)
+    make_transaction(db, user, account, amount=Decimal("5.00"))
+    _rel(db, refund, original, RelationshipType.REFUNDS, "40.00")
+
+    assert get_transactions_by_category(db, user.db_id) == {
+        "Groceries": Decimal("75.00"),
+        "Uncategorized": Decimal("5.00"),
+    }
+
+
+def test_transactions_by_category_scales_refunded_splits(db, user, account, query_counter):
+    food = make_category(db, name="Food")
+    home = make_category(db, name="Home")
+    split = make_transaction(db, user, account, amount=Decimal("60.00"))
+    refunded = make_transaction(db, user, account, amount=Decimal("100.00"))
+    refund = make_transaction(db, user, account, amount=Decimal("50.00"), transaction_type=TransactionType.CREDIT)
+    _rel(db, refund, refunded, RelationshipType.REFUNDS, "50.00")
+    for txn, cat, amount in ((split, food, "40.00"), (split, home, "20.00"),
+                             (refunded, food, "70.00"), (refunded, home, "30.00")):
+        db.add(TransactionSplitAllocationDB(uuid=uuid4(), transaction_id=txn.db_id,
+                                            category_id=cat.db_id, amount=Decimal(amount)))
+    db.flush()
+    user_id = user.db_id
+    query_counter.clear()
+
+    totals = get_transactions_by_category(db, user_id)
+    assert (totals["Food"], totals["Home"]) == (Decimal("75.00"), Decimal("35.00"))
+    # refund links, plain sum, refunded rows, split sum, refunded splits
+    assert len(query_counter) == 5
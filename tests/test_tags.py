@@ -5,8 +5,9 @@ seeded with `ensure_system_tags` so the 403 "system tags cannot be
 modified/deleted" guards can be exercised — the harness skips the startup hook
 that would normally seed them. TagResponse exposes its UUID under "id".
 """
+from datetime import date
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -41,8 +42,40 @@ def test_create_duplicate_name_400(client):
     assert "already exists" in resp.json()["detail"]
 
 
+def test_create_duplicate_name_differing_in_case_400_without_lookups(client, db, test_user, query_counter):
+    from src.crud import crud_tag
+    from src.models.tag import TagCreate
+
+    _make_tag(client, name="Groceries")
+    user_id = test_user.db_id
+    query_counter.clear()
+
+    with pytest.raises(ValueError, match="already exists"):
+        crud_tag.create_db_tag(db, user_id, TagCreate(tag_name="  groceries "))
+    # the rejected INSERT, then the user check on the failure path only
+    assert len([q for q in query_counter if "SAVEPOINT" not in q]) == 2
+    assert query_counter[0].startswith("INSERT INTO tags")
+
+
+def test_create_reports_other_constraint_failures_generically(client, db, test_user, monkeypatch):
+    from src.crud import crud_tag
+    from src.models.tag import TagCreate
+
+    taken = UUID(_make_tag(client, name="First")["id"])
+    # A uuid clash is an IntegrityError that is not a duplicate name
+    monkeypatch.setattr(crud_tag, "uuid4", lambda: taken)
+
+    with pytest.raises(ValueError, match="database constraint"):
+        crud_tag.create_db_tag(db, test_user.db_id, TagCreate(tag_name="Second"))
+
+
 def test_create_invalid_color_422(client):
     assert client.post("/tags/", json={"tag_name": "Bad", "color": "zzzzzz"}).status_code == 422
+    assert client.post("/tags/", json={"tag_name": "Bare", "color": "1a2b3c"}).status_code == 422
+
+
+def test_color_is_normalized_to_uppercase(client):
+    assert _make_tag(client, name="Lower", color="#a1b2c3")["color"] == "#A1B2C3"
 
 
 def test_create_blank_name_422(client):
@@ -93,6 +126,35 @@ def test_update_tag_200(client):
     assert resp.json()["tag_name"] == "New"
 
 
+def test_rename_onto_existing_name_in_other_case_400_but_own_case_change_ok(client):
+    _make_tag(client, name="Travel")
+    tag = _make_tag(client, name="Trips")
+
+    resp = client.put(f"/tags/{tag['id']}", json={"tag_name": "TRAVEL"})
+    assert resp.status_code == 400
+    assert "already exists" in resp.json()["detail"]
+    resp = client.put(f"/tags/{tag['id']}", json={"tag_name": "TRIPS"})
+    assert resp.status_code == 200
+    assert resp.json()["tag_name"] == "TRIPS"
+
+
+def test_update_by_uuid_reuses_the_loaded_tag(client, db, test_user, query_counter):
+    from src.crud import crud_tag
+    from src.models.tag import TagUpdate
+
+    tag = _make_tag(client, name="Loaded")
+    user_id = test_user.db_id
+    db.expire_all()
+    query_counter.clear()
+
+    updated = crud_tag.update_db_tag_by_uuid(db, UUID(tag["id"]), user_id, TagUpdate(color="#00FF00"))
+    assert updated.color == "#00FF00"
+    # uuid lookup + post-commit refresh; the by-id update finds the tag in the
+    # identity map instead of selecting it again
+    assert len([q for q in query_counter if q.startswith("SELECT tags")]) == 2
+    assert any(q.startswith("UPDATE tags") for q in query_counter)
+
+
 def test_update_unknown_404(client):
     assert client.put(f"/tags/{uuid4()}", json={"tag_name": "X"}).status_code == 404
 
@@ -103,6 +165,27 @@ def test_delete_tag_204(client):
     assert client.get(f"/tags/{tag['id']}").status_code == 404
 
 
+def test_delete_tag_removes_links_in_two_guarded_statements(client, db, test_user, query_counter):
+    from src.crud import crud_tag
+    from src.db.core import NotFoundError, TransactionTagDB
+
+    acct = make_account(db, test_user)
+    txn = make_transaction(db, test_user, acct)
+    tag = _make_tag(client, name="Linked")
+    client.post("/tags/transactions/", params={"transaction_uuid": str(txn.uuid), "tag_uuid": tag["id"]})
+    user_id = test_user.db_id
+    tag_id = crud_tag.read_db_tag_by_uuid(db, UUID(tag["id"]), user_id).db_id
+
+    with pytest.raises(NotFoundError):
+        crud_tag.delete_db_tag(db, tag_id, user_id + 1)
+    assert db.query(TransactionTagDB).filter(TransactionTagDB.tag_id == tag_id).count() == 1
+
+    query_counter.clear()
+    assert crud_tag.delete_db_tag(db, tag_id, user_id) is True
+    assert [q.split()[0] for q in query_counter if "SAVEPOINT" not in q] == ["DELETE", "DELETE"]
+    assert db.query(TransactionTagDB).filter(TransactionTagDB.tag_id == tag_id).count() == 0
+
+
 def test_update_system_tag_403(client, db, test_user):
     ensure_system_tags(test_user.db_id, db)
     sys_tag = get_system_tag(test_user.db_id, db, "Needs Review")
@@ -116,6 +199,40 @@ def test_delete_system_tag_403(client, db, test_user):
     assert client.delete(f"/tags/{sys_tag.uuid}").status_code == 403
 
 
+def test_tag_list_reads_raise_on_unloaded_relationships(client, db, test_user):
+    from sqlalchemy.exc import InvalidRequestError
+    from src.crud import crud_tag
+
+    _make_tag(client, name="Guarded")
+    db.expire_all()
+    for tags in (
+        crud_tag.read_db_tags(db, test_user.db_id),
+        crud_tag.search_tags(db, test_user.db_id, "guard"),
+    ):
+        assert [t.tag_name for t in tags] == ["Guarded"]
+        with pytest.raises(InvalidRequestError):
+            tags[0].transaction_tags
+
+
+def test_list_tags_with_transaction_counts_in_one_query(client, db, test_user, query_counter):
+    acct = make_account(db, test_user)
+    busy = _make_tag(client, name="Busy")
+    _make_tag(client, name="Idle")
+    for i in range(3):
+        txn = make_transaction(db, test_user, acct, description=f"Txn {i}")
+        client.post("/tags/transactions/", params={"transaction_uuid": str(txn.uuid), "tag_uuid": busy["id"]})
+
+    user_id = test_user.db_id
+    query_counter.clear()
+    from src.crud import crud_tag
+    tags = crud_tag.read_db_tags(db, user_id, include_transaction_count=True)
+    assert len(query_counter) == 1
+    assert [(t.tag_name, t.transaction_count) for t in tags] == [("Busy", 3), ("Idle", 0)]
+
+    listed = client.get("/tags/", params={"include_transaction_count": True}).json()
+    assert [(t["tag_name"], t["transaction_count"]) for t in listed] == [("Busy", 3), ("Idle", 0)]
+
+
 # ===== TAG <-> TRANSACTION ASSOCIATION =====
 
 def test_add_and_list_tag_on_transaction(client, db, test_user):
@@ -139,6 +256,66 @@ def test_add_tag_duplicate_400(client, db, test_user):
     assert client.post("/tags/transactions/", params=params).status_code == 400
 
 
+def test_relinking_a_tag_is_skipped_by_the_insert_not_an_integrity_error(db, test_user):
+    from src.crud import crud_tag
+    from src.db.core import TransactionTagDB, bulk_insert_ignoring_conflicts
+    from src.models.tag import TagCreate
+
+    acct = make_account(db, test_user)
+    txn = make_transaction(db, test_user, acct)
+    tag = crud_tag.create_db_tag(db, test_user.db_id, TagCreate(tag_name="Twice"))
+    pair = {"transaction_id": txn.db_id, "tag_id": tag.db_id}
+    key = ("transaction_id", "tag_id")
+
+    assert bulk_insert_ignoring_conflicts(db, TransactionTagDB, [dict(pair)], key) == [(txn.db_id, tag.db_id)]
+    assert bulk_insert_ignoring_conflicts(db, TransactionTagDB, [dict(pair)], key) == []
+    assert bulk_insert_ignoring_conflicts(db, TransactionTagDB, [], key) == []
+    db.commit()
+
+    with pytest.raises(ValueError, match="already tagged"):
+        crud_tag.add_tag_to_transaction(db, test_user.db_id, txn.db_id, tag.db_id)
+    assert db.query(TransactionTagDB).filter_by(**pair).count() == 1
+
+
+def test_add_tag_by_id_checks_both_owners_in_one_query(client, db, test_user, query_counter):
+    from src.crud import crud_tag
+    from src.db.core import NotFoundError
+
+    acct = make_account(db, test_user)
+    txn = make_transaction(db, test_user, acct)
+    tag = _make_tag(client, name="ById")
+    user_id, txn_id = test_user.db_id, txn.db_id
+    tag_id = crud_tag.read_db_tag_by_uuid(db, UUID(tag["id"]), user_id).db_id
+    query_counter.clear()
+
+    link = crud_tag.add_tag_to_transaction(db, user_id, txn_id, tag_id)
+    assert (link.transaction_id, link.tag_id) == (txn_id, tag_id)
+    # ownership check, INSERT, reload of the new link
+    assert len([q for q in query_counter if "SAVEPOINT" not in q]) == 3
+
+    with pytest.raises(NotFoundError):
+        crud_tag.remove_tag_from_transaction(db, user_id + 1, txn_id, tag_id)
+    assert crud_tag.remove_tag_from_transaction(db, user_id, txn_id, tag_id) is True
+
+
+def test_tags_for_transaction_checks_ownership_with_exists(client, db, test_user, query_counter):
+    from src.crud import crud_tag
+    from src.db.core import NotFoundError
+
+    acct = make_account(db, test_user)
+    txn = make_transaction(db, test_user, acct)
+    tag = _make_tag(client, name="Owned")
+    client.post("/tags/transactions/", params={"transaction_uuid": str(txn.uuid), "tag_uuid": tag["id"]})
+    user_id, txn_id = test_user.db_id, txn.db_id
+    query_counter.clear()
+
+    assert [t.tag_name for t in crud_tag.get_tags_for_transaction(db, txn_id, user_id)] == ["Owned"]
+    assert len(query_counter) == 2
+    assert "EXISTS" in query_counter[0] and "transactions.description" not in query_counter[0]
+    with pytest.raises(NotFoundError):
+        crud_tag.get_tags_for_transaction(db, txn_id, user_id + 1)
+
+
 def test_remove_tag_from_transaction_204(client, db, test_user):
     acct = make_account(db, test_user)
     txn = make_transaction(db, test_user, acct)
@@ -170,6 +347,61 @@ def test_bulk_tag_transactions(client, db, test_user):
     assert resp.json()["tagged_count"] == 2
 
 
+def test_bulk_tag_resolves_transaction_uuids_in_one_query(client, db, test_user, query_counter):
+    acct = make_account(db, test_user)
+    txns = [make_transaction(db, test_user, acct) for _ in range(4)]
+    tag = _make_tag(client, name="Resolved")
+    uuids = [str(t.uuid) for t in txns]
+    query_counter.clear()
+
+    resp = client.post("/tags/transactions/bulk-tag", json={"transaction_uuids": uuids, "tag_uuid": tag["id"]})
+    assert resp.status_code == 201
+    assert len([q for q in query_counter if "FROM transactions" in q and "transactions.uuid IN" in q]) == 1
+
+    unknown = str(uuid4())
+    resp = client.post("/tags/transactions/bulk-tag", json={"transaction_uuids": uuids[:1] + [unknown], "tag_uuid": tag["id"]})
+    assert resp.status_code == 404
+    assert unknown in resp.json()["detail"]
+
+
+def test_bulk_tag_names_transactions_the_user_does_not_own(client, db, test_user):
+    from src.crud import crud_tag
+
+    acct = make_account(db, test_user)
+    txn = make_transaction(db, test_user, acct)
+    tag = _make_tag(client, name="Owned")
+    user_id = test_user.db_id
+    tag_id = crud_tag.read_db_tag_by_uuid(db, UUID(tag["id"]), user_id).db_id
+
+    with pytest.raises(ValueError, match=r"\[999999\]"):
+        crud_tag.bulk_tag_transactions(db, user_id, [txn.db_id, 999999], tag_id)
+
+
+def test_bulk_tag_skips_already_tagged_without_per_row_queries(client, db, test_user, query_counter):
+    from src.crud import crud_tag
+    from src.db.core import TransactionTagDB
+
+    acct = make_account(db, test_user)
+    txns = [make_transaction(db, test_user, acct) for _ in range(5)]
+    tag = _make_tag(client, name="Batch")
+    client.post("/tags/transactions/", params={"transaction_uuid": str(txns[0].uuid), "tag_uuid": tag["id"]})
+    user_id = test_user.db_id
+    txn_ids = [t.db_id for t in txns]
+    tag_id = crud_tag.read_db_tag_by_uuid(db, UUID(tag["id"]), user_id).db_id
+    query_counter.clear()
+
+    assert crud_tag.bulk_tag_transactions(db, user_id, txn_ids, tag_id) == 4
+    # tag check, ownership count, existing-pairs lookup, one INSERT
+    assert len([q for q in query_counter if "SAVEPOINT" not in q]) == 4
+    assert len(crud_tag.get_transactions_for_tag(db, tag_id, user_id)) == 5
+    batch_times = {
+        created_at for (created_at,) in db.query(TransactionTagDB.created_at).filter(
+            TransactionTagDB.tag_id == tag_id, TransactionTagDB.transaction_id.in_(txn_ids[1:])
+        )
+    }
+    assert len(batch_times) == 1
+
+
 def test_bulk_tag_unknown_tag_404(client, db, test_user):
     acct = make_account(db, test_user)
     t1 = make_transaction(db, test_user, acct)
@@ -193,3 +425,99 @@ def test_tag_stats(client, db, test_user):
 
     all_stats = client.get("/tags/stats").json()
     assert any(s["id"] == tag["id"] for s in all_stats)
+
+
+def test_tag_stats_amount_aggregates(client, db, test_user):
+    acct = make_account(db, test_user)
+    tag = _make_tag(client, name="Summed")
+    for amount, day in (("40.00", 1), ("10.50", 9)):
+        txn = make_transaction(db, test_user, acct, amount=Decimal(amount), transaction_date=date(2026, 2, day))
+        client.post("/tags/transactions/", params={"transaction_uuid": str(txn.uuid), "tag_uuid": tag["id"]})
+
+    stats = client.get(f"/tags/{tag['id']}/stats").json()
+    assert stats["transaction_count"] == 2
+    assert stats["total_amount"] == pytest.approx(50.50)
+    assert stats["average_amount"] == pytest.approx(25.25)
+    assert stats["most_recent_use"].startswith("2026-02-09")
+
+
+def test_tag_stats_by_uuid_is_one_aggregate_query(client, db, test_user, query_counter):
+    from src.crud import crud_tag
+    from src.db.core import NotFoundError
+
+    acct = make_account(db, test_user)
+    tag = _make_tag(client, name="Single")
+    txn = make_transaction(db, test_user, acct, amount=Decimal("12.00"))
+    client.post("/tags/transactions/", params={"transaction_uuid": str(txn.uuid), "tag_uuid": tag["id"]})
+    user_id = test_user.db_id
+    query_counter.clear()
+
+    stats = crud_tag.get_tag_stats_by_uuid(db, UUID(tag["id"]), user_id)
+    assert (stats.transaction_count, stats.total_amount) == (1, pytest.approx(12.0))
+    assert len(query_counter) == 1
+    assert "sum(" in query_counter[0].lower()
+    with pytest.raises(NotFoundError):
+        crud_tag.get_tag_stats_by_uuid(db, uuid4(), user_id)
+
+
+def test_all_tag_stats_aggregate_in_one_query(client, db, test_user, query_counter):
+    from src.crud import crud_tag
+
+    acct = make_account(db, test_user)
+    busy = _make_tag(client, name="Busy")
+    once = _make_tag(client, name="Once")
+    unused = _make_tag(client, name="Unused")
+    for amount, day, tags in (("40.00", 1, (busy, once)), ("10.50", 9, (busy,))):
+        txn = make_transaction(db, test_user, acct, amount=Decimal(amount), transaction_date=date(2026, 2, day))
+        for tag in tags:
+            client.post("/tags/transactions/", params={"transaction_uuid": str(txn.uuid), "tag_uuid": tag["id"]})
+    user_id = test_user.db_id
+    query_counter.clear()
+
+    stats = {str(s.id): s for s in crud_tag.get_all_tag_stats(db, user_id)}
+    assert len(query_counter) == 1
+    assert stats[busy["id"]].transaction_count == 2
+    assert stats[busy["id"]].total_amount == pytest.approx(50.50)
+    assert stats[busy["id"]].average_amount == pytest.approx(25.25)
+    assert stats[busy["id"]].most_recent_use.date() == date(2026, 2, 9)
+    assert stats[once["id"]].transaction_count == 1
+    assert stats[unused["id"]].transaction_count == 0
+    assert stats[unused["id"]].most_recent_use is None
+    # Built with model_construct: the aggregate values must already be what
+    # validation would have produced
+    from src.models.tag import TagStats
+    for s in stats.values():
+        assert TagStats.model_validate(s.model_dump()) == s
+        assert type(s.total_amount) is float and type(s.average_amount) is float
+
+
+def test_tag_transactions_pages_are_stable_across_same_day_rows(client, db, test_user):
+    acct = make_account(db, test_user)
+    tag = _make_tag(client, name="Paged")
+    for _ in range(4):
+        txn = make_transaction(db, test_user, acct, transaction_date=date(2026, 3, 1))
+        client.post("/tags/transactions/", params={"transaction_uuid": str(txn.uuid), "tag_uuid": tag["id"]})
+
+    pages = [
+        client.get(f"/tags/{tag['id']}/transactions", params={"skip": skip, "limit": 1}).json()[0]["id"]
+        for skip in range(4)
+    ]
+    assert len(set(pages)) == 4
+
+
+def test_tag_transactions_listing_query_count_is_constant(client, db, test_user, query_counter):
+    acct = make_account(db, test_user)
+    tag = _make_tag(client, name="Batched")
+    for _ in range(4):
+        txn = make_transaction(db, test_user, acct)
+        client.post("/tags/transactions/", params={"transaction_uuid": str(txn.uuid), "tag_uuid": tag["id"]})
+    db.expire_all()
+    query_counter.clear()
+
+    resp = client.get(f"/tags/{tag['id']}/transactions")
+    assert resp.status_code == 200
+    assert len(resp.json()) == 4
+    assert all(t["account_uuid"] == str(acct.uuid) for t in resp.json())
+    # tag lookups + one page query + one IN-query per eager-loaded collection;
+    # independent of the page size.
+    assert 0 < len(query_counter) <= 6
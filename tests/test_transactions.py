@@ -12,7 +12,8 @@ from uuid import uuid4
 
 import pytest
 
-from src.db.core import AccountType, TagDB, TransactionTagDB, TransactionType
+import src.db.core as db_core
+from src.db.core import AccountType, SourceType, TagDB, TransactionDB, TransactionTagDB, TransactionType, bulk_insert
 from src.services.system_tags import ensure_system_tags
 from src.utils.time import utcnow
 from tests.factories import make_account, make_category, make_transaction, make_user
@@ -148,6 +149,51 @@ def test_list_pagination(client, db, test_user):
     assert len(client.get("/transactions/", params={"skip": 2}).json()) == 1
 
 
+def test_list_keyset_pages_follow_after_uuid(client, db, test_user):
+    acct = make_account(db, test_user)
+    for day in (1, 2, 2, 2, 3):
+        make_transaction(db, test_user, acct, transaction_date=date(2026, 1, day))
+    full = [t["id"] for t in client.get("/transactions/").json()]
+
+    pages, after = [], None
+    while True:
+        params = {"limit": 2, **({"after_uuid": after} if after else {})}
+        page = [t["id"] for t in client.get("/transactions/", params=params).json()]
+        if not page:
+            break
+        pages += page
+        after = page[-1]
+    assert pages == full
+
+    oldest_first = [t["id"] for t in client.get("/transactions/", params={"order_desc": False}).json()]
+    rest = client.get("/transactions/", params={"order_desc": False, "after_uuid": oldest_first[1]}).json()
+    assert [t["id"] for t in rest] == oldest_first[2:]
+
+
+def test_list_after_uuid_errors(client, db, test_user):
+    acct = make_account(db, test_user)
+    txn = make_transaction(db, test_user, acct)
+    assert client.get("/transactions/", params={"after_uuid": str(uuid4())}).status_code == 404
+    resp = client.get("/transactions/", params={"after_uuid": str(txn.uuid), "order_by": "amount"})
+    assert resp.status_code == 400
+
+
+def test_list_serializes_without_extra_lazy_loads(client, db, test_user):
+    # The list query runs with raiseload("*", sql_only=True): any relationship
+    # serialization touches that isn't eager-loaded raises instead of N+1-ing.
+    acct = make_account(db, test_user)
+    parent = make_category(db, name="Household")
+    sub = make_category(db, name="Cleaning", parent_category_id=parent.db_id)
+    make_transaction(db, test_user, acct, category_id=sub.db_id)
+    db.expunge_all()
+
+    resp = client.get("/transactions/")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body[0]["account_uuid"] == str(acct.uuid)
+    assert body[0]["category"]["parent_category_uuid"] == str(parent.uuid)
+
+
 def test_list_filter_unknown_account_404(client):
     assert client.get("/transactions/", params={"account_uuid": str(uuid4())}).status_code == 404
 
@@ -212,6 +258,46 @@ def test_delete_transaction_204(client, db, test_user):
     assert client.get(f"/transactions/{txn.uuid}").status_code == 404
 
 
+def test_balance_moves_by_sql_delta_and_delete_reverses_it(client, db, test_user, query_counter):
+    acct = make_account(db, test_user, balance=Decimal("100.00"))
+    body = {
+        "account_uuid": str(acct.uuid),
+        "transactions": [
+            _payload(acct.uuid, amount="10.00", description="a"),
+            _payload(acct.uuid, amount="5.50", description="b"),
+            _payload(acct.uuid, amount="40.00", description="c", transaction_type="DEPOSIT"),
+        ],
+    }
+    query_counter.clear()
+    client.post("/transactions/bulk-upload/", json=body)
+    balance_updates = [q for q in query_counter if q.startswith("UPDATE accounts")]
+    assert len(balance_updates) == 1 and "balance=(accounts.balance +" in balance_updates[0]
+    db.refresh(acct)
+    assert acct.balance == Decimal("124.50")
+
+    created = client.post("/transactions/", json=_payload(acct.uuid, amount="30.00")).json()
+    db.refresh(acct)
+    assert acct.balance == Decimal("94.50")
+    assert client.delete(f"/transactions/{created['id']}").status_code == 204
+    db.refresh(acct)
+    assert acct.balance == Decimal("124.50")
+
+
+def test_delete_reverses_transfers_and_card_withdrawals_exactly(client, db, test_user):
+    # Reversal is the exact inverse of the forward delta, including the types
+    # the old per-type reversal rules got wrong
+    checking = make_account(db, test_user, balance=Decimal("100.00"))
+    card = make_account(db, test_user, account_name="Test Card", account_type=AccountType.CREDIT_CARD,
+                        balance=Decimal("100.00"))
+    for acct, transaction_type in ((checking, "TRANSFER_OUT"), (card, "TRANSFER_IN"), (card, "WITHDRAWAL")):
+        created = client.post(
+            "/transactions/", json=_payload(acct.uuid, amount="30.00", transaction_type=transaction_type)
+        ).json()
+        assert client.delete(f"/transactions/{created['id']}").status_code == 204
+        db.refresh(acct)
+        assert acct.balance == Decimal("100.00"), transaction_type
+
+
 def test_delete_unknown_404(client):
     assert client.delete(f"/transactions/{uuid4()}").status_code == 404
 
@@ -550,6 +636,65 @@ def test_bulk_upload_creates_transactions(client, db, test_user):
     assert len(resp.json()) == 2
 
 
+def test_bulk_upload_inserts_all_rows_in_one_returning_statement(db, test_user, query_counter):
+    from src.crud.crud_transaction import bulk_create_transactions
+    from src.models.transaction import TransactionImport
+
+    acct = make_account(db, test_user)
+    transaction_import = TransactionImport.model_validate({
+        "account_uuid": str(acct.uuid),
+        "transactions": [
+            _payload(acct.uuid, amount=f"{i}.00", description=f"Row {i}", transaction_date=f"2026-02-0{i}")
+            for i in range(1, 6)
+        ],
+    })
+    user_id, account_id = test_user.db_id, acct.db_id
+    query_counter.clear()
+
+    created = bulk_create_transactions(db, user_id, transaction_import, account_id=account_id)
+    inserts = [q for q in query_counter if q.startswith("INSERT INTO transactions")]
+    assert len(inserts) == 1 and "RETURNING" in inserts[0]
+    assert [t.description for t in created] == [f"Row {i}" for i in range(1, 6)]
+    assert all(t.uuid is not None and t.created_at is not None for t in created)
+
+
+def test_bulk_upload_reuses_the_loaded_user_and_account(db, test_user, query_counter):
+    from src.crud.crud_transaction import bulk_create_transactions
+    from src.models.transaction import TransactionImport
+
+    acct = make_account(db, test_user)
+    transaction_import = TransactionImport.model_validate({
+        "account_uuid": str(acct.uuid), "transactions": [_payload(acct.uuid)],
+    })
+    user_id, account_id = test_user.db_id, acct.db_id
+    query_counter.clear()
+
+    bulk_create_transactions(db, user_id, transaction_import, account_id=account_id)
+    before_insert = query_counter[:next(i for i, q in enumerate(query_counter) if q.startswith("INSERT"))]
+    assert not [q for q in before_insert if "FROM users" in q or "FROM accounts" in q]
+
+
+def test_bulk_upload_skips_stored_rows_and_keeps_in_upload_repeats(client, db, test_user, query_counter):
+    acct = make_account(db, test_user)
+    first = {"account_uuid": str(acct.uuid), "transactions": [_payload(acct.uuid, description="kept")]}
+    assert len(client.post("/transactions/bulk-upload/", json=first).json()) == 1
+
+    body = {
+        "account_uuid": str(acct.uuid),
+        "transactions": [
+            _payload(acct.uuid, description="kept"),
+            _payload(acct.uuid, description="new"),
+            _payload(acct.uuid, description="new"),
+        ],
+    }
+    query_counter.clear()
+    created = client.post("/transactions/bulk-upload/", json=body).json()
+    # Only the stored row is a duplicate; identical rows within one upload
+    # (same day, amount and description) are legitimate and both imported.
+    assert [t["description"] for t in created] == ["new", "new"]
+    assert len([q for q in query_counter if "transactions.transaction_hash IN" in q]) == 1
+
+
 def test_bulk_upload_unknown_account_404(client):
     body = {"account_uuid": str(uuid4()), "transactions": []}
     assert client.post("/transactions/bulk-upload/", json=body).status_code == 404
@@ -694,3 +839,38 @@ def test_guard_bulk_upload_rejects_investment_target(client, db, test_user):
     _, invest = _guard_accounts(db, test_user)
     body = {"account_uuid": str(invest.uuid), "transactions": [_payload(invest.uuid)], "source_type": "CSV"}
     assert client.post("/transactions/bulk-upload/", json=body).status_code == 400
+
+
+# ===== BULK INSERT FAST PATH =====
+
+def test_bulk_insert_inserts_transaction_rows_with_defaults(db, test_user):
+    acct = make_account(db, test_user)
+    rows = [
+        dict(
+            user_id=test_user.db_id, account_id=acct.db_id, transaction_hash=uuid4().hex,
+            source_type=SourceType.CSV, transaction_date=date(2026, 3, i + 1),
+            amount=Decimal("10.00") + i, transaction_type=TransactionType.PURCHASE,
+            description=f"Row {i}",
+        )
+        for i in range(3)
+    ]
+    assert bulk_insert(db, TransactionDB, rows) == 3
+    assert bulk_insert(db, TransactionDB, []) == 0
+
+    stored = db.query(TransactionDB).filter(TransactionDB.account_id == acct.db_id).all()
+    assert len(stored) == 3
+    assert all(t.uuid is not None and t.created_at is not None for t in stored)
+
+
+def test_existing_rows_by_hash_batches_and_scopes_to_user(db, test_user, monkeypatch):
+    monkeypatch.setattr(db_core, "HASH_LOOKUP_BATCH_SIZE", 2)
+    acct = make_account(db, test_user)
+    mine = [make_transaction(db, test_user, acct) for _ in range(5)]
+    other = make_user(db, email="other-hash@example.com", username="otherhash")
+    theirs = make_transaction(db, other, make_account(db, other))
+
+    wanted = [t.transaction_hash for t in mine] + [theirs.transaction_hash, "missing"]
+    found = db_core.existing_rows_by_hash(db, TransactionDB, test_user.db_id, wanted)
+
+    assert found == {t.transaction_hash: t for t in mine}
+    assert db_core.existing_hashes(db, TransactionDB, test_user.db_id, wanted) == set(found)
@@ -7,10 +7,13 @@ which exercises the whole session-management half of the router over HTTP
 (list, get, reject/restore item, extend, cancel) plus the DB-backed job
 endpoints — all without a real file or external calls.
 """
+from datetime import date
+from decimal import Decimal
 from uuid import uuid4
 
 import pytest
 
+from src.db.core import SkippedTransactionDB, UploadJobDB
 from src.services.preview_session import create_preview_session
 
 pytestmark = pytest.mark.integration
@@ -49,6 +52,30 @@ def test_get_skipped_unknown_job_404(client):
     assert client.get(f"/uploads/jobs/{uuid4()}/skipped").status_code == 404
 
 
+def test_get_skipped_returns_full_data_without_per_row_loads(client, db, test_user, query_counter):
+    job = UploadJobDB(uuid=uuid4(), user_id=test_user.db_id, institution="TD Bank")
+    db.add(job)
+    db.flush()
+    for i in range(3):
+        db.add(SkippedTransactionDB(
+            upload_job_id=job.db_id, transaction_type="REGULAR",
+            parsed_date=date(2026, 1, i + 1), parsed_amount=Decimal("5.00"),
+            parsed_description=f"Dup {i}", parsed_transaction_type="PURCHASE",
+            parsed_data_json={"row": i},
+        ))
+    db.flush()
+    db.expunge_all()
+    query_counter.clear()
+
+    resp = client.get(f"/uploads/jobs/{job.uuid}/skipped")
+    assert resp.status_code == 200, resp.text
+    rows = resp.json()["items"]
+    assert sorted(r["skipped_transaction"]["full_data"]["row"] for r in rows) == [0, 1, 2]
+    # Job lookup + skipped rows; the deferred payload column
+    # must come back in the listing query, not one lazy load per row.
+    assert len(query_counter) == 2
+
+
 def test_jobs_unauthenticated_401(unauth_client):
     assert unauth_client.get("/uploads/jobs").status_code == 401
 